@@ -1,11 +1,55 @@
 import pandas as pd
-import pandas_ta as ta
+import numpy as np
 import os
 
 # File paths
 historical_file = "files/NIFTY MIDCAP150 MOMENTUM 50_his.csv"
 current_file = "files/NIFTY-QUALITY-LOW-VOLATILITY-today.csv"
 
+# --- EMA helpers (one pass over the symbol-sorted frame) ---
+def segmented_ema(values, groups, length):
+    """
+    pandas_ta.ema (SMA seed over the first `length` bars, then span EMA)
+    for every symbol at once; `values` must be sorted by group.
+    """
+    pos = values.groupby(groups, sort=False).cumcount()
+    sma = values.groupby(groups, sort=False).rolling(length).mean().droplevel(0)
+
+    seeded = values.where(pos >= length, np.nan)
+    seeded = seeded.mask(pos == length - 1, sma)
+
+    return seeded.groupby(groups, sort=False).ewm(span=length, adjust=False).mean().droplevel(0)
+
+
+def ema_crossover_screen(df_hist, fast=10, slow=20, min_bars=30):
+    """
+    Latest fast/slow EMA per symbol: bullish = fast above slow,
+    crossed = fast moved above slow on the last bar.
+    """
+    # histories repeat the same few hundred dates, parse each one once
+    codes, uniques = pd.factorize(df_hist['DATE'])
+    dates = pd.to_datetime(pd.Series(uniques), dayfirst=True, errors='coerce').to_numpy()[codes]
+
+    df = df_hist.assign(DATE=dates).sort_values(['SYMBOL', 'DATE'], kind='stable').reset_index(drop=True)
+
+    # integer group keys: every groupby below reuses them without re-hashing strings
+    sym = pd.Series(pd.factorize(df['SYMBOL'])[0], index=df.index)
+    df['EMA_FAST'] = segmented_ema(df['CLOSE'], sym, fast)
+    df['EMA_SLOW'] = segmented_ema(df['CLOSE'], sym, slow)
+
+    g = df.groupby(sym, sort=False)
+    above = df['EMA_FAST'] > df['EMA_SLOW']
+    was_above = above.groupby(sym, sort=False).shift(1, fill_value=False)
+
+    latest = df.assign(BULLISH=above, CROSSED=above & ~was_above, BARS=g['CLOSE'].transform('size'))
+    latest = latest.groupby(sym, sort=False).tail(1)
+    latest = latest[latest['BARS'] >= min_bars]
+
+    return latest[['SYMBOL', 'DATE', 'CLOSE', 'EMA_FAST', 'EMA_SLOW', 'BULLISH', 'CROSSED']].rename(
+        columns={'EMA_FAST': f'EMA_{fast}', 'EMA_SLOW': f'EMA_{slow}'}
+    ).reset_index(drop=True)
+
+
 # --- Part 1: EMA Bullish Screening from Historical Data ---
 if os.path.exists(historical_file):
     df_hist = pd.read_csv(historical_file)
@@ -25,22 +69,15 @@ if os.path.exists(historical_file):
     for col in ['OPEN', 'HIGH', 'LOW', 'CLOSE']:
         df_hist[col] = pd.to_numeric(df_hist[col].astype(str).str.replace(',', ''), errors='coerce')
 
-    bullish_ema_stocks = []
-
-    for symbol in df_hist['SYMBOL'].unique():
-        stock_data = df_hist[df_hist['SYMBOL'] == symbol].sort_values('DATE')
+    ema_screen = ema_crossover_screen(df_hist, fast=10, slow=20)
+    bullish_ema_stocks = ema_screen.loc[ema_screen['BULLISH'], 'SYMBOL'].tolist()
+    crossover_stocks = ema_screen.loc[ema_screen['CROSSED'], 'SYMBOL'].tolist()
 
-        if len(stock_data) < 30:
-            continue
-
-        stock_data['EMA_10'] = ta.ema(stock_data['CLOSE'], length=10)
-        stock_data['EMA_20'] = ta.ema(stock_data['CLOSE'], length=20)
-
-        if stock_data['EMA_20'].iloc[-1] > stock_data['EMA_20'].iloc[-1]:
-            bullish_ema_stocks.append(symbol)
-
-    print("\n📈 EMA Bullish Candidates (10 EMA > 21 EMA):")
+    print("\n📈 EMA Bullish Candidates (10 EMA > 20 EMA):")
     print(bullish_ema_stocks)
+
+    print("\n✨ Fresh EMA Crossovers (10 EMA crossed above 20 EMA today):")
+    print(crossover_stocks)
 else:
     print("\n⚠️ Historical file not found. Skipping EMA-based screening.")
 
@@ -1,6 +1,14 @@
 import tkinter as tk
 from tkinter import ttk
 
+from pathlib import Path
+
+from position_engine import ACTION_TEXT
+from position_journal import PositionJournal
+
+TRADE = "TRADE"
+JOURNAL_DIR = Path(__file__).resolve().parent / "journal"
+
 class LiveTradeManager:
     def __init__(self, root):
         self.root = root
@@ -12,11 +20,22 @@ class LiveTradeManager:
         self.qty_var = tk.IntVar()
         self.price_var = tk.DoubleVar()
 
-        self.initial_risk = 0
-        self.current_trail_sl = 0
+        # all trade state lives in the headless engine, this is just a view;
+        # the journal brings an open trade back after a restart
+        self.journal = PositionJournal.recover(JOURNAL_DIR)
+        self.book = self.journal.book
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         self.build_ui()
 
+        if TRADE in self.book:
+            slot = self.book.slots[TRADE]
+            self.entry_var.set(self.book.entry[slot])
+            self.sl_var.set(self.book.entry[slot] - self.book.initial_risk[slot])
+            self.qty_var.set(int(self.book.qty[slot]))
+            self.log("♻️ Trade recovered from journal")
+            self.log(f"Trailing SL: {self.book.trail_sl[slot]:.2f}")
+
     def build_ui(self):
         frame = ttk.Frame(self.root, padding=10)
         frame.pack(fill="both", expand=True)
@@ -50,44 +69,34 @@ class LiveTradeManager:
         entry = self.entry_var.get()
         sl = self.sl_var.get()
 
-        self.initial_risk = entry - sl
-        self.current_trail_sl = sl
+        if TRADE in self.book:
+            self.journal.close_position(TRADE)
+        slot = self.journal.open_position(TRADE, entry, sl, self.qty_var.get())
 
         self.output.delete("1.0", tk.END)
         self.log("Trade started")
-        self.log(f"Initial Risk per share: {self.initial_risk:.2f}")
+        self.log(f"Initial Risk per share: {self.book.initial_risk[slot]:.2f}")
         self.log(f"Initial Stop Loss: {sl:.2f}")
 
     def update_trade(self):
-        entry = self.entry_var.get()
+        if TRADE not in self.book:
+            self.log("⚠️ Start the trade first")
+            return
+
         qty = self.qty_var.get()
-        price = self.price_var.get()
-
-        r_move = price - entry
-        r_multiple = r_move / self.initial_risk if self.initial_risk > 0 else 0
-        pnl = r_move * qty
-
-        # trailing SL logic
-        new_trail = price - self.initial_risk
-        if new_trail > self.current_trail_sl:
-            self.current_trail_sl = new_trail
-
-        self.log(f"\nCurrent Price: {price:.2f}")
-        self.log(f"P&L: {pnl:.2f}")
-        self.log(f"R Multiple: {r_multiple:.2f}R")
-        self.log(f"Trailing SL: {self.current_trail_sl:.2f}")
-
-        # action suggestions
-        if r_multiple >= 2:
-            self.log("👉 Action: Book partial profits")
-        elif r_multiple >= 1.5:
-            self.log("👉 Action: Trail SL aggressively")
-        elif r_multiple >= 1:
-            self.log("👉 Action: Move SL to Entry (risk-free)")
-        elif price <= self.current_trail_sl:
-            self.log("❌ Stop hit. Exit trade.")
-        else:
-            self.log("⏳ Hold position")
+        if qty != self.book.qty[self.book.slots[TRADE]]:
+            self.journal.set_qty(TRADE, qty)
+        res = self.journal.update_prices([TRADE], [self.price_var.get()])
+
+        self.log(f"\nCurrent Price: {res['price'][0]:.2f}")
+        self.log(f"P&L: {res['pnl'][0]:.2f}")
+        self.log(f"R Multiple: {res['r_multiple'][0]:.2f}R")
+        self.log(f"Trailing SL: {res['trail_sl'][0]:.2f}")
+        self.log(ACTION_TEXT[res["action"][0]])
+
+    def on_close(self):
+        self.journal.close()
+        self.root.destroy()
 
 if __name__ == "__main__":
     root = tk.Tk()
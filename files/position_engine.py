@@ -0,0 +1,215 @@
+import numpy as np
+
+# =========================================================
+# ACTIONS (same rules / wording as LiveTradeManager)
+# =========================================================
+HOLD = 0
+MOVE_SL_TO_ENTRY = 1
+TRAIL_AGGRESSIVE = 2
+BOOK_PARTIAL = 3
+STOP_HIT = 4
+
+ACTION_TEXT = {
+    HOLD: "⏳ Hold position",
+    MOVE_SL_TO_ENTRY: "👉 Action: Move SL to Entry (risk-free)",
+    TRAIL_AGGRESSIVE: "👉 Action: Trail SL aggressively",
+    BOOK_PARTIAL: "👉 Action: Book partial profits",
+    STOP_HIT: "❌ Stop hit. Exit trade.",
+}
+
+
+class PositionBook:
+    """
+    Headless multi-position manager.
+
+    Open positions live in parallel NumPy arrays (one slot per symbol);
+    price updates arrive in batches and P&L, R multiple, trailing SL and
+    the suggested action are computed for the whole batch at once.
+    """
+
+    def __init__(self, capacity=256):
+        self.slots = {}             # symbol -> slot
+        self.symbols = []           # slot -> symbol
+        self._free = []
+
+        self.entry = np.zeros(capacity)
+        self.initial_risk = np.zeros(capacity)
+        self.trail_sl = np.zeros(capacity)
+        self.qty = np.zeros(capacity, dtype=np.int64)
+        self.last_price = np.full(capacity, np.nan)
+        self.is_open = np.zeros(capacity, dtype=bool)
+
+    # -----------------------------------------------------
+    # positions
+    # -----------------------------------------------------
+    def _grow(self):
+        n = len(self.entry)
+        for name in ["entry", "initial_risk", "trail_sl", "qty", "last_price", "is_open"]:
+            old = getattr(self, name)
+            new = np.zeros(n * 2, dtype=old.dtype)
+            if name == "last_price":
+                new[:] = np.nan
+            new[:n] = old
+            setattr(self, name, new)
+
+    def open_position(self, symbol, entry, stop_loss, qty):
+        if symbol in self.slots:
+            raise ValueError(f"{symbol} is already open")
+
+        if self._free:
+            slot = self._free.pop()
+            self.symbols[slot] = symbol
+        else:
+            slot = len(self.symbols)
+            if slot == len(self.entry):
+                self._grow()
+            self.symbols.append(symbol)
+
+        self.slots[symbol] = slot
+        self.entry[slot] = entry
+        self.initial_risk[slot] = entry - stop_loss
+        self.trail_sl[slot] = stop_loss
+        self.qty[slot] = qty
+        self.last_price[slot] = np.nan
+        self.is_open[slot] = True
+        return slot
+
+    def close_position(self, symbol):
+        slot = self.slots.pop(symbol)
+        self.is_open[slot] = False
+        self.symbols[slot] = None
+        self._free.append(slot)
+        return slot
+
+    def set_qty(self, symbol, qty):
+        self.qty[self.slots[symbol]] = qty
+
+    def set_trail_sl(self, symbol, trail_sl):
+        self.trail_sl[self.slots[symbol]] = trail_sl
+
+    def copy(self):
+        """
+        Independent copy of the book (arrays copied, no re-allocation).
+        """
+        book = object.__new__(PositionBook)
+        book.slots = dict(self.slots)
+        book.symbols = list(self.symbols)
+        book._free = list(self._free)
+        for name in ["entry", "initial_risk", "trail_sl", "qty", "last_price", "is_open"]:
+            setattr(book, name, getattr(self, name).copy())
+        return book
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __contains__(self, symbol):
+        return symbol in self.slots
+
+    # -----------------------------------------------------
+    # price updates
+    # -----------------------------------------------------
+    def lookup(self, symbols):
+        """
+        Symbols -> slots (-1 for symbols with no open position).
+        """
+        get = self.slots.get
+        return np.fromiter((get(s, -1) for s in symbols), dtype=np.int64, count=len(symbols))
+
+    def update_slots(self, slots, prices):
+        """
+        Apply a batch of (slot, price) updates in arrival order.
+
+        Returns a dict of arrays aligned with the batch:
+        slot, price, pnl, r_multiple, trail_sl, action.
+        """
+        slots = np.asarray(slots, dtype=np.int64)
+        prices = np.asarray(prices, dtype=float)
+        n = len(slots)
+
+        out = {
+            "slot": slots,
+            "price": prices,
+            "pnl": np.full(n, np.nan),
+            "r_multiple": np.full(n, np.nan),
+            "trail_sl": np.full(n, np.nan),
+            "action": np.full(n, HOLD, dtype=np.int8),
+        }
+
+        valid = slots >= 0
+        valid[valid] = self.is_open[slots[valid]]
+        if not valid.any():
+            return out
+
+        # k-th update of the same slot goes in round k, so every round
+        # touches each slot at most once and the trail stays sequential
+        idx = np.flatnonzero(valid)
+        order = idx[np.argsort(slots[idx], kind="stable")]
+        s = slots[order]
+        pos = np.arange(len(s))
+        starts = np.r_[True, s[1:] != s[:-1]]
+        rank = pos - np.maximum.accumulate(np.where(starts, pos, 0))
+
+        for k in range(rank.max() + 1):
+            sel = order[rank == k]
+            self._apply(sel, slots[sel], prices[sel], out)
+
+        return out
+
+    def _apply(self, sel, sl, px, out):
+        entry = self.entry[sl]
+        risk = self.initial_risk[sl]
+
+        r_move = px - entry
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r_multiple = np.where(risk > 0, r_move / risk, 0.0)
+
+        # trailing SL only ever moves up
+        trail = np.maximum(self.trail_sl[sl], px - risk)
+        self.trail_sl[sl] = trail
+        self.last_price[sl] = px
+
+        out["pnl"][sel] = r_move * self.qty[sl]
+        out["r_multiple"][sel] = r_multiple
+        out["trail_sl"][sel] = trail
+        out["action"][sel] = np.select(
+            [r_multiple >= 2, r_multiple >= 1.5, r_multiple >= 1, px <= trail],
+            [BOOK_PARTIAL, TRAIL_AGGRESSIVE, MOVE_SL_TO_ENTRY, STOP_HIT],
+            HOLD,
+        )
+
+    def update_prices(self, symbols, prices):
+        return self.update_slots(self.lookup(symbols), prices)
+
+    def snapshot(self):
+        """
+        Open positions as a dict of arrays (for views / persistence).
+        """
+        idx = np.flatnonzero(self.is_open)
+        price = self.last_price[idx]
+        return {
+            "symbol": [self.symbols[i] for i in idx],
+            "entry": self.entry[idx],
+            "initial_risk": self.initial_risk[idx],
+            "trail_sl": self.trail_sl[idx],
+            "qty": self.qty[idx],
+            "last_price": price,
+            "pnl": (price - self.entry[idx]) * self.qty[idx],
+        }
+
+
+if __name__ == "__main__":
+    import time
+
+    # throughput check: 500 positions, 100k updates in 1k-tick batches
+    rng = np.random.default_rng(0)
+    book = PositionBook()
+    syms = [f"S{i}" for i in range(500)]
+    for s in syms:
+        book.open_position(s, 100.0, 95.0, 10)
+
+    slots = book.lookup(syms)
+    t0 = time.perf_counter()
+    for _ in range(100):
+        book.update_slots(rng.choice(slots, 1000), 100 + rng.normal(0, 3, 1000))
+    dt = time.perf_counter() - t0
+    print(f"{100_000 / dt:,.0f} updates/sec")
@@ -1,5 +1,3 @@
-import tkinter as tk
-from tkinter import ttk
 from datetime import datetime
 
 # Main analysis logic
@@ -92,66 +90,70 @@ def analyze_trade():
         result_output.config(state="disabled")
 
 
-# --- GUI Setup ---
-root = tk.Tk()
-root.title("Advanced Swing Trade Analyzer")
-root.geometry("1020x700")
-root.configure(bg="#f9f9f9")
-
-style = ttk.Style()
-style.configure("TLabel", font=("Segoe UI", 10))
-style.configure("TButton", font=("Segoe UI", 10, "bold"), padding=6)
-style.configure("Treeview.Heading", font=("Segoe UI", 10, "bold"))
-
-# Input Frame
-input_frame = tk.LabelFrame(root, text="Trade Input Parameters", font=("Segoe UI", 12, "bold"), bg="#e9f1ff", padx=10, pady=10)
-input_frame.pack(fill="x", padx=10, pady=10)
-
-labels = [
-    ("Stock Name:", 0, 0), ("Revenue Growth %:", 1, 0), ("EPS Growth %:", 2, 0),
-    ("Debt to Equity:", 3, 0), ("ROE %:", 4, 0), ("EMA Crossover:", 1, 2),
-    ("RSI Value:", 2, 2), ("MACD Signal:", 3, 2), ("Volume Spike:", 4, 2),
-    ("Chart Pattern:", 5, 0), ("Sector Trending:", 5, 2)
-]
-
-for text, row, col in labels:
-    tk.Label(input_frame, text=text, bg="#e9f1ff").grid(row=row, column=col, sticky="w", padx=5, pady=4)
-
-# Entries
-stock_entry = tk.Entry(input_frame); stock_entry.grid(row=0, column=1)
-revenue_entry = tk.Entry(input_frame); revenue_entry.grid(row=1, column=1)
-eps_entry = tk.Entry(input_frame); eps_entry.grid(row=2, column=1)
-debt_entry = tk.Entry(input_frame); debt_entry.grid(row=3, column=1)
-roe_entry = tk.Entry(input_frame); roe_entry.grid(row=4, column=1)
-rsi_entry = tk.Entry(input_frame); rsi_entry.grid(row=2, column=3)
-
-# Comboboxes
-ema_var = ttk.Combobox(input_frame, values=["Yes", "No"], state="readonly"); ema_var.grid(row=1, column=3)
-macd_var = ttk.Combobox(input_frame, values=["Bullish", "Bearish"], state="readonly"); macd_var.grid(row=3, column=3)
-volume_var = ttk.Combobox(input_frame, values=["Yes", "No"], state="readonly"); volume_var.grid(row=4, column=3)
-pattern_var = ttk.Combobox(input_frame, values=["None", "Breakout", "Consolidation", "Reversal"], state="readonly"); pattern_var.grid(row=5, column=1)
-sector_var = ttk.Combobox(input_frame, values=["Yes", "No"], state="readonly"); sector_var.grid(row=5, column=3)
-
-# Analyze Button
-analyze_btn = tk.Button(root, text="Analyze Trade", bg="dark green", fg="white", command=analyze_trade)
-analyze_btn.pack(pady=10)
-
-# Result Frame
-result_frame = tk.LabelFrame(root, text="Analysis Output", font=("Segoe UI", 12, "bold"), padx=10, pady=10)
-result_frame.pack(fill="x", padx=10)
-
-result_output = tk.Text(result_frame, height=10, state="disabled", bg="#f4f4f4", wrap="word", font=("Segoe UI", 10))
-result_output.pack(fill="x")
-
-# Trade Table
-table_frame = tk.LabelFrame(root, text="Saved Swing Trades", font=("Segoe UI", 12, "bold"))
-table_frame.pack(fill="both", expand=True, padx=10, pady=10)
-
-trade_table = ttk.Treeview(table_frame, columns=("Stock", "Sentiment", "Advice", "Date"), show="headings", height=8)
-for col in ("Stock", "Sentiment", "Advice", "Date"):
-    trade_table.heading(col, text=col)
-    trade_table.column(col, anchor="center", stretch=True)
-
-trade_table.pack(fill="both", expand=True)
-
-root.mainloop()
+if __name__ == "__main__":
+    import tkinter as tk
+    from tkinter import ttk
+
+    # --- GUI Setup ---
+    root = tk.Tk()
+    root.title("Advanced Swing Trade Analyzer")
+    root.geometry("1020x700")
+    root.configure(bg="#f9f9f9")
+
+    style = ttk.Style()
+    style.configure("TLabel", font=("Segoe UI", 10))
+    style.configure("TButton", font=("Segoe UI", 10, "bold"), padding=6)
+    style.configure("Treeview.Heading", font=("Segoe UI", 10, "bold"))
+
+    # Input Frame
+    input_frame = tk.LabelFrame(root, text="Trade Input Parameters", font=("Segoe UI", 12, "bold"), bg="#e9f1ff", padx=10, pady=10)
+    input_frame.pack(fill="x", padx=10, pady=10)
+
+    labels = [
+        ("Stock Name:", 0, 0), ("Revenue Growth %:", 1, 0), ("EPS Growth %:", 2, 0),
+        ("Debt to Equity:", 3, 0), ("ROE %:", 4, 0), ("EMA Crossover:", 1, 2),
+        ("RSI Value:", 2, 2), ("MACD Signal:", 3, 2), ("Volume Spike:", 4, 2),
+        ("Chart Pattern:", 5, 0), ("Sector Trending:", 5, 2)
+    ]
+
+    for text, row, col in labels:
+        tk.Label(input_frame, text=text, bg="#e9f1ff").grid(row=row, column=col, sticky="w", padx=5, pady=4)
+
+    # Entries
+    stock_entry = tk.Entry(input_frame); stock_entry.grid(row=0, column=1)
+    revenue_entry = tk.Entry(input_frame); revenue_entry.grid(row=1, column=1)
+    eps_entry = tk.Entry(input_frame); eps_entry.grid(row=2, column=1)
+    debt_entry = tk.Entry(input_frame); debt_entry.grid(row=3, column=1)
+    roe_entry = tk.Entry(input_frame); roe_entry.grid(row=4, column=1)
+    rsi_entry = tk.Entry(input_frame); rsi_entry.grid(row=2, column=3)
+
+    # Comboboxes
+    ema_var = ttk.Combobox(input_frame, values=["Yes", "No"], state="readonly"); ema_var.grid(row=1, column=3)
+    macd_var = ttk.Combobox(input_frame, values=["Bullish", "Bearish"], state="readonly"); macd_var.grid(row=3, column=3)
+    volume_var = ttk.Combobox(input_frame, values=["Yes", "No"], state="readonly"); volume_var.grid(row=4, column=3)
+    pattern_var = ttk.Combobox(input_frame, values=["None", "Breakout", "Consolidation", "Reversal"], state="readonly"); pattern_var.grid(row=5, column=1)
+    sector_var = ttk.Combobox(input_frame, values=["Yes", "No"], state="readonly"); sector_var.grid(row=5, column=3)
+
+    # Analyze Button
+    analyze_btn = tk.Button(root, text="Analyze Trade", bg="dark green", fg="white", command=analyze_trade)
+    analyze_btn.pack(pady=10)
+
+    # Result Frame
+    result_frame = tk.LabelFrame(root, text="Analysis Output", font=("Segoe UI", 12, "bold"), padx=10, pady=10)
+    result_frame.pack(fill="x", padx=10)
+
+    result_output = tk.Text(result_frame, height=10, state="disabled", bg="#f4f4f4", wrap="word", font=("Segoe UI", 10))
+    result_output.pack(fill="x")
+
+    # Trade Table
+    table_frame = tk.LabelFrame(root, text="Saved Swing Trades", font=("Segoe UI", 12, "bold"))
+    table_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+    trade_table = ttk.Treeview(table_frame, columns=("Stock", "Sentiment", "Advice", "Date"), show="headings", height=8)
+    for col in ("Stock", "Sentiment", "Advice", "Date"):
+        trade_table.heading(col, text=col)
+        trade_table.column(col, anchor="center", stretch=True)
+
+    trade_table.pack(fill="both", expand=True)
+
+    root.mainloop()
@@ -1,7 +1,3 @@
-import tkinter as tk
-from tkinter import messagebox
-
-
 def analyze_stock():
     try:
         # Get inputs
@@ -55,50 +51,54 @@ def analyze_stock():
         messagebox.showerror("Input Error", "Please enter valid numeric values for all fields.")
 
 
-# Tkinter window
-root = tk.Tk()
-root.title("Swing Trade Stock Selector")
-
-tk.Label(root, text="Stock Name").grid(row=0, column=0)
-entry_stock_name = tk.Entry(root)
-entry_stock_name.grid(row=0, column=1)
-
-labels = [
-    "Market Cap (in Cr)",
-    "Return on Equity (%)",
-    "Profit Growth (%)",
-    "YOY Profit Growth (%)",
-    "Debt to Equity",
-    "OCF > Net Profit (3Y) [1=True, 0=False]",
-    "Net Profit % of Revenue",
-    "P/E Ratio",
-    "ROCE (%)",
-    "Profit Growth (3Y) (%)",
-    "EPS (Latest Quarter)"
-]
-
-entries = []
-for i, label in enumerate(labels):
-    tk.Label(root, text=label).grid(row=i + 1, column=0)
-    if "OCF" in label:
-        var_ocf_gt_np = tk.IntVar()
-        entry = tk.Entry(root, textvariable=var_ocf_gt_np)
-    else:
-        entry = tk.Entry(root)
-    entry.grid(row=i + 1, column=1)
-    entries.append(entry)
-
-(entry_market_cap, entry_roe, entry_profit_growth, entry_yoy_profit_growth, entry_debt_to_equity,
- _, entry_net_profit_percent, entry_pe_ratio, entry_roce, entry_profit_growth_3yr, entry_eps) = entries
-
-tk.Button(root, text="Analyze", command=analyze_stock).grid(row=13, column=0, columnspan=2, pady=10)
-
-tk.Label(root, text="Analysis Result").grid(row=14, column=0, columnspan=2)
-result_text = tk.Text(root, height=12, width=50)
-result_text.grid(row=15, column=0, columnspan=2)
-
-tk.Label(root, text="Valid Stocks").grid(row=0, column=3)
-valid_listbox = tk.Listbox(root, height=20, width=30)
-valid_listbox.grid(row=1, column=3, rowspan=15)
-
-root.mainloop()
+if __name__ == "__main__":
+    import tkinter as tk
+    from tkinter import messagebox
+
+    # Tkinter window
+    root = tk.Tk()
+    root.title("Swing Trade Stock Selector")
+
+    tk.Label(root, text="Stock Name").grid(row=0, column=0)
+    entry_stock_name = tk.Entry(root)
+    entry_stock_name.grid(row=0, column=1)
+
+    labels = [
+        "Market Cap (in Cr)",
+        "Return on Equity (%)",
+        "Profit Growth (%)",
+        "YOY Profit Growth (%)",
+        "Debt to Equity",
+        "OCF > Net Profit (3Y) [1=True, 0=False]",
+        "Net Profit % of Revenue",
+        "P/E Ratio",
+        "ROCE (%)",
+        "Profit Growth (3Y) (%)",
+        "EPS (Latest Quarter)"
+    ]
+
+    entries = []
+    for i, label in enumerate(labels):
+        tk.Label(root, text=label).grid(row=i + 1, column=0)
+        if "OCF" in label:
+            var_ocf_gt_np = tk.IntVar()
+            entry = tk.Entry(root, textvariable=var_ocf_gt_np)
+        else:
+            entry = tk.Entry(root)
+        entry.grid(row=i + 1, column=1)
+        entries.append(entry)
+
+    (entry_market_cap, entry_roe, entry_profit_growth, entry_yoy_profit_growth, entry_debt_to_equity,
+     _, entry_net_profit_percent, entry_pe_ratio, entry_roce, entry_profit_growth_3yr, entry_eps) = entries
+
+    tk.Button(root, text="Analyze", command=analyze_stock).grid(row=13, column=0, columnspan=2, pady=10)
+
+    tk.Label(root, text="Analysis Result").grid(row=14, column=0, columnspan=2)
+    result_text = tk.Text(root, height=12, width=50)
+    result_text.grid(row=15, column=0, columnspan=2)
+
+    tk.Label(root, text="Valid Stocks").grid(row=0, column=3)
+    valid_listbox = tk.Listbox(root, height=20, width=30)
+    valid_listbox.grid(row=1, column=3, rowspan=15)
+
+    root.mainloop()
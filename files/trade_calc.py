@@ -0,0 +1,372 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Tk-free trade calculators: the GUIs in "swing final cal.py" and
+# "gui intract caL.py" import the scalar versions from here, batch_*()
+# evaluate whole tables of what-if setups at once.
+
+BROKERAGE_FACTOR = 0.0545
+
+INPUT_COLUMNS = [
+    "capital", "entry_price", "stop_loss_price", "target_price",
+    "risk_perc", "reward_ratio", "manual_position_size", "trade_duration",
+]
+
+
+# =========================================================
+# SINGLE SETUP
+# =========================================================
+def enhanced_trade_calculator(
+    capital=None,
+    entry_price=None,
+    stop_loss_price=None,
+    target_price=None,
+    risk_perc=None,
+    reward_ratio=None,
+    manual_position_size=None,
+    trade_duration=None
+):
+    if not capital or not entry_price:
+        return "❌ Capital and Entry Price are required."
+
+    if stop_loss_price is not None:
+        risk_per_share = entry_price - stop_loss_price
+        if risk_per_share <= 0:
+            return "❌ Stop-loss must be below entry price."
+    elif risk_perc and capital:
+        risk_amount = capital * (risk_perc / 100)
+        position_size_estimate = int(capital // entry_price) or 1
+        risk_per_share = risk_amount / position_size_estimate
+        stop_loss_price = entry_price - risk_per_share
+    else:
+        return "❌ Either Stop-Loss Price or Risk % is required."
+
+    if manual_position_size:
+        position_size = manual_position_size
+        risk_amount = risk_per_share * position_size
+    else:
+        if risk_perc and capital:
+            risk_amount = capital * (risk_perc / 100)
+            position_size = int(risk_amount // risk_per_share)
+        else:
+            position_size = int(capital // entry_price)
+            risk_amount = risk_per_share * position_size
+
+    invested_amount = position_size * entry_price
+
+    if reward_ratio and not target_price:
+        reward_per_share = risk_per_share * reward_ratio
+        target_price = entry_price + reward_per_share
+    elif target_price:
+        reward_per_share = target_price - entry_price
+        reward_ratio = reward_per_share / risk_per_share if risk_per_share else 0
+    else:
+        return "❌ Either Target Price or Reward Ratio is required."
+
+    expected_profit = reward_per_share * position_size
+    net_profit_after_brokerage = expected_profit * (1 - BROKERAGE_FACTOR)
+    percent_gain = (expected_profit / capital) * 100 if capital else 0
+    break_even_price = entry_price + (risk_amount / position_size if position_size else 0)
+    capital_usage_percent = (invested_amount / capital) * 100 if capital else 0
+    risk_on_invested_percent = (risk_amount / invested_amount) * 100 if invested_amount else 0
+    risk_adjusted_return = (reward_ratio / risk_on_invested_percent) * 100 if risk_on_invested_percent else 0
+
+    if trade_duration and trade_duration > 0:
+        daily_gain = (target_price / entry_price) ** (1 / trade_duration) - 1
+        cagr = ((target_price / entry_price) ** (365 / trade_duration) - 1) * 100
+        estimated_exit_date = datetime.today() + timedelta(days=trade_duration)
+        reward_per_day = expected_profit / trade_duration
+        risk_per_day = risk_amount / trade_duration
+        profit_per_day = (expected_profit - risk_amount) / trade_duration
+    else:
+        daily_gain = cagr = reward_per_day = risk_per_day = profit_per_day = estimated_exit_date = None
+    return {
+        "Entry Price": round(entry_price, 2),
+        "Stop-Loss Price": round(stop_loss_price, 2),
+        "Target Price": round(target_price, 2),
+        "Break-Even Price": round(break_even_price, 2),
+        "Risk per Share": round(risk_per_share, 2),
+        "Reward per Share": round(reward_per_share, 2),
+        "Reward Ratio": round(reward_ratio, 2),
+        "Risk Amount (₹)": round(risk_amount, 2),
+        "Position Size": position_size,
+        "Invested Amount (₹)": round(invested_amount, 2),
+        "Capital Usage %": round(capital_usage_percent, 2),
+        "Risk on Invested %": round(risk_on_invested_percent, 2),
+        "Risk-Adjusted Return": round(risk_adjusted_return, 2),
+        "Expected Profit (₹)": round(expected_profit, 2),
+        "Net Profit After Brokerage (₹)": round(net_profit_after_brokerage, 2),
+        "Expected % Gain": round(percent_gain, 2),
+        "Profit per Day (₹)": round(profit_per_day, 2) if profit_per_day is not None else "N/A",
+        "Risk per Day (₹)": round(risk_per_day, 2) if risk_per_day is not None else "N/A",
+        "Reward per Day (₹)": round(reward_per_day, 2) if reward_per_day is not None else "N/A",
+        "Daily Gain %": round(daily_gain * 100, 2) if daily_gain is not None else "N/A",
+        "Estimated CAGR %": round(cagr, 2) if cagr is not None else "N/A",
+        "Estimated Exit Date": estimated_exit_date.strftime("%Y-%m-%d") if estimated_exit_date else "N/A"
+    }
+
+
+def general_trade_calculator(
+    capital=None,
+    entry_price=None,
+    stop_loss_price=None,
+    target_price=None,
+    risk_perc=None,
+    reward_ratio=None,
+    manual_position_size=None
+):
+    if not capital or not entry_price:
+        return "❌ Capital and Entry Price are required."
+
+    if stop_loss_price:
+        risk_per_share = entry_price - stop_loss_price
+        if risk_per_share <= 0:
+            return "❌ Stop-loss must be below entry price."
+    elif risk_perc and capital:
+        risk_amount = capital * (risk_perc / 100)
+        risk_per_share = risk_amount / (capital / entry_price)
+        stop_loss_price = entry_price - risk_per_share
+    else:
+        return "❌ Either Stop-Loss Price or Risk % is required."
+
+    if manual_position_size:
+        position_size = manual_position_size
+        risk_amount = risk_per_share * position_size
+    else:
+        risk_amount = capital * (risk_perc / 100) if risk_perc else risk_per_share * (capital // entry_price)
+        position_size = int(risk_amount // risk_per_share)
+
+    invested_amount = position_size * entry_price
+
+    if reward_ratio and not target_price:
+        reward_per_share = risk_per_share * reward_ratio
+        target_price = entry_price + reward_per_share
+    elif target_price:
+        reward_per_share = target_price - entry_price
+        reward_ratio = reward_per_share / risk_per_share
+    else:
+        return "❌ Either Target Price or Reward Ratio is required."
+
+    expected_profit = reward_per_share * position_size
+    percent_gain = (expected_profit / capital) * 100
+
+    return {
+        "Entry Price": entry_price,
+        "Stop-Loss Price": round(stop_loss_price, 2),
+        "Target Price": round(target_price, 2),
+        "Risk per Share": round(risk_per_share, 2),
+        "Reward per Share": round(reward_per_share, 2),
+        "Reward Ratio": round(reward_ratio, 2),
+        "Risk Amount (₹)": round(risk_amount, 2),
+        "Position Size": position_size,
+        "Invested Amount (₹)": round(invested_amount, 2),
+        "Expected Profit (₹)": round(expected_profit, 2),
+        "Expected % Gain": round(percent_gain, 2),
+    }
+
+
+# =========================================================
+# BATCH
+# =========================================================
+def _inputs(setups):
+    df = setups.reindex(columns=INPUT_COLUMNS)
+    cols = {c: pd.to_numeric(df[c], errors="coerce").to_numpy(dtype=float) for c in INPUT_COLUMNS}
+    # the scalar versions test `if x:`, so 0 behaves like a missing value
+    truthy = {c: np.nan_to_num(v) != 0 for c, v in cols.items()}
+    return df.index, cols, truthy
+
+
+def _round(x):
+    return np.round(x, 2)
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def batch_enhanced_trade_calculator(setups):
+    """
+    enhanced_trade_calculator() over every row of `setups` (columns named
+    like its arguments). Rows the scalar version rejects keep their message
+    in "Error"; "N/A" per-day fields are NaN here.
+    """
+    index, c, t = _inputs(setups)
+    capital, entry, stop = c["capital"], c["entry_price"], c["stop_loss_price"]
+    risk_perc, manual = c["risk_perc"], c["manual_position_size"]
+    target, rr_in, duration = c["target_price"], c["reward_ratio"], c["trade_duration"]
+
+    error = np.full(len(index), None, dtype=object)
+    base_ok = t["capital"] & t["entry_price"]
+    error[~base_ok] = "❌ Capital and Entry Price are required."
+
+    has_stop = ~np.isnan(stop)
+    use_risk = ~has_stop & t["risk_perc"]
+
+    # stop from risk % when no stop price was given
+    est_size = np.floor_divide(capital, entry)
+    est_size = np.where(est_size == 0, 1, est_size)
+    rps = np.where(has_stop, entry - stop, capital * (risk_perc / 100) / est_size)
+    stop = np.where(has_stop, stop, entry - rps)
+
+    error[base_ok & has_stop & (rps <= 0)] = "❌ Stop-loss must be below entry price."
+    error[base_ok & ~has_stop & ~use_risk] = "❌ Either Stop-Loss Price or Risk % is required."
+
+    size = np.where(
+        t["manual_position_size"], manual,
+        np.where(t["risk_perc"],
+                 np.floor_divide(capital * (risk_perc / 100), rps),
+                 np.floor_divide(capital, entry)),
+    )
+    risk_amount = np.where(
+        ~t["manual_position_size"] & t["risk_perc"],
+        capital * (risk_perc / 100),
+        rps * size,
+    )
+    invested = size * entry
+
+    from_rr = t["reward_ratio"] & ~t["target_price"]
+    reward = np.where(from_rr, rps * rr_in, target - entry)
+    target = np.where(from_rr, entry + reward, target)
+    rr = np.where(from_rr, rr_in, np.where(rps != 0, reward / rps, 0))
+    error[base_ok & ~from_rr & ~t["target_price"] & (error == None)] = \
+        "❌ Either Target Price or Reward Ratio is required."  # noqa: E711
+
+    expected_profit = reward * size
+    risk_on_invested = np.where(invested != 0, risk_amount / invested * 100, 0)
+
+    timed = t["trade_duration"] & (duration > 0)
+    d = np.where(timed, duration, np.nan)
+    daily_gain = (target / entry) ** (1 / d) - 1
+    cagr = ((target / entry) ** (365 / d) - 1) * 100
+
+    exit_date = pd.Timestamp(datetime.today()) + pd.to_timedelta(d, unit="D")
+
+    out = pd.DataFrame({
+        "Entry Price": _round(entry),
+        "Stop-Loss Price": _round(stop),
+        "Target Price": _round(target),
+        "Break-Even Price": _round(entry + np.where(size != 0, risk_amount / size, 0)),
+        "Risk per Share": _round(rps),
+        "Reward per Share": _round(reward),
+        "Reward Ratio": _round(rr),
+        "Risk Amount (₹)": _round(risk_amount),
+        "Position Size": size,
+        "Invested Amount (₹)": _round(invested),
+        "Capital Usage %": _round(invested / capital * 100),
+        "Risk on Invested %": _round(risk_on_invested),
+        "Risk-Adjusted Return": _round(np.where(risk_on_invested != 0, rr / risk_on_invested * 100, 0)),
+        "Expected Profit (₹)": _round(expected_profit),
+        "Net Profit After Brokerage (₹)": _round(expected_profit * (1 - BROKERAGE_FACTOR)),
+        "Expected % Gain": _round(expected_profit / capital * 100),
+        "Profit per Day (₹)": _round((expected_profit - risk_amount) / d),
+        "Risk per Day (₹)": _round(risk_amount / d),
+        "Reward per Day (₹)": _round(expected_profit / d),
+        "Daily Gain %": _round(daily_gain * 100),
+        "Estimated CAGR %": _round(cagr),
+        "Estimated Exit Date": exit_date.strftime("%Y-%m-%d"),
+    }, index=index)
+    return _finish(out, error)
+
+
+@np.errstate(divide="ignore", invalid="ignore")
+def batch_general_trade_calculator(setups):
+    """
+    general_trade_calculator() over every row of `setups`.
+    """
+    index, c, t = _inputs(setups)
+    capital, entry, stop = c["capital"], c["entry_price"], c["stop_loss_price"]
+    risk_perc, manual = c["risk_perc"], c["manual_position_size"]
+    target, rr_in = c["target_price"], c["reward_ratio"]
+
+    error = np.full(len(index), None, dtype=object)
+    base_ok = t["capital"] & t["entry_price"]
+    error[~base_ok] = "❌ Capital and Entry Price are required."
+
+    has_stop = t["stop_loss_price"]
+    use_risk = ~has_stop & t["risk_perc"]
+
+    rps = np.where(has_stop, entry - stop, capital * (risk_perc / 100) / (capital / entry))
+    stop = np.where(has_stop, stop, entry - rps)
+
+    error[base_ok & has_stop & (rps <= 0)] = "❌ Stop-loss must be below entry price."
+    error[base_ok & ~has_stop & ~use_risk] = "❌ Either Stop-Loss Price or Risk % is required."
+
+    auto_risk = np.where(t["risk_perc"], capital * (risk_perc / 100), rps * np.floor_divide(capital, entry))
+    size = np.where(t["manual_position_size"], manual, np.floor_divide(auto_risk, rps))
+    risk_amount = np.where(t["manual_position_size"], rps * size, auto_risk)
+
+    from_rr = t["reward_ratio"] & ~t["target_price"]
+    reward = np.where(from_rr, rps * rr_in, target - entry)
+    target = np.where(from_rr, entry + reward, target)
+    rr = np.where(from_rr, rr_in, reward / rps)
+    error[base_ok & ~from_rr & ~t["target_price"] & (error == None)] = \
+        "❌ Either Target Price or Reward Ratio is required."  # noqa: E711
+
+    expected_profit = reward * size
+
+    out = pd.DataFrame({
+        "Entry Price": entry,
+        "Stop-Loss Price": _round(stop),
+        "Target Price": _round(target),
+        "Risk per Share": _round(rps),
+        "Reward per Share": _round(reward),
+        "Reward Ratio": _round(rr),
+        "Risk Amount (₹)": _round(risk_amount),
+        "Position Size": size,
+        "Invested Amount (₹)": _round(size * entry),
+        "Expected Profit (₹)": _round(expected_profit),
+        "Expected % Gain": _round(expected_profit / capital * 100),
+    }, index=index)
+    return _finish(out, error)
+
+
+def _finish(out, error):
+    bad = error != None  # noqa: E711
+    out.loc[bad, :] = np.nan
+    size = out["Position Size"]
+    # a manual size may be fractional (kept as-is, like the scalar calculators)
+    if (size.dropna() % 1 == 0).all():
+        out["Position Size"] = size.astype("Int64")
+    out["Error"] = error
+    return out
+
+
+# =========================================================
+# FILES / CLI
+# =========================================================
+def read_table(path):
+    path = Path(path)
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def write_table(df, path):
+    path = Path(path)
+    if path.suffix == ".parquet":
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def run_batch(in_path, out_path=None, general=False):
+    setups = read_table(in_path)
+    calc = batch_general_trade_calculator if general else batch_enhanced_trade_calculator
+    results = calc(setups)
+
+    out_path = out_path or Path(in_path).with_name(Path(in_path).stem + "_results.csv")
+    write_table(setups.join(results), out_path)
+
+    ok = results["Error"].isna().sum()
+    print(f"✅ {ok}/{len(results)} setups evaluated → {out_path}")
+    return results
+
+
+if __name__ == "__main__":
+    # python trade_calc.py setups.csv [results.csv|.parquet] [--general]
+    args = [a for a in sys.argv[1:] if a != "--general"]
+    if not args:
+        print("usage: python trade_calc.py setups.csv [results.csv|.parquet] [--general]")
+        sys.exit(1)
+    run_batch(args[0], args[1] if len(args) > 1 else None, general="--general" in sys.argv)
@@ -0,0 +1,206 @@
+from bisect import bisect_left, bisect_right
+from itertools import count
+from typing import NamedTuple
+
+# =========================================================
+# SIDES
+# =========================================================
+BELOW = "below"     # fires when price <= level (stops)
+ABOVE = "above"     # fires when price >= level (targets, breakouts)
+
+
+class Trigger(NamedTuple):
+    id: int
+    symbol: str
+    side: str
+    level: float
+    tag: str
+    payload: object
+
+
+class _Book:
+    """
+    Pending levels for one symbol and side, kept sorted as parallel lists.
+
+    Levels are stored as keys that sort so the next level to fire is at
+    the tail: the level itself for BELOW, -level for ABOVE. Firing then
+    always truncates the tail. add / remove use list.insert / del, an O(n)
+    memmove in the number of levels on that symbol and side (a handful
+    per position), which is cheap next to a Python-level scan.
+    """
+    __slots__ = ("sign", "keys", "ids")
+
+    def __init__(self, side):
+        self.sign = 1.0 if side == BELOW else -1.0
+        self.keys = []
+        self.ids = []
+
+    def add(self, level, tid):
+        key = self.sign * level
+        # equal levels fire oldest first: append BELOW ties after, ABOVE ties before
+        i = bisect_right(self.keys, key) if self.sign > 0 else bisect_left(self.keys, key)
+        self.keys.insert(i, key)
+        self.ids.insert(i, tid)
+
+    def remove(self, level, tid):
+        key = self.sign * level
+        i = bisect_left(self.keys, key)
+        j = bisect_right(self.keys, key)
+        k = self.ids.index(tid, i, j)
+        del self.keys[k]
+        del self.ids[k]
+
+    def pop_crossed(self, price):
+        """
+        Ids of every level crossed by `price`, in level order.
+        """
+        key = self.sign * price
+        if not self.keys or key > self.keys[-1]:
+            return []
+        i = bisect_left(self.keys, key)
+        ids = self.ids[i:]
+        del self.keys[i:], self.ids[i:]
+        return ids if self.sign > 0 else ids[::-1]
+
+
+class TriggerIndex:
+    """
+    Per-symbol index of pending price levels.
+
+    A new price fires only the crossed levels, found by bisection and
+    popped off the tail of the sorted list: O(log n + k) per symbol instead
+    of scanning every position / alert.
+    Triggers are one-shot; re-add (or move) a level to re-arm it.
+    """
+
+    def __init__(self):
+        self._books = {}      # (symbol, side) -> _Book
+        self._triggers = {}   # id -> Trigger
+        self._ids = count(1)
+
+    def __len__(self):
+        return len(self._triggers)
+
+    def add(self, symbol, side, level, tag="", payload=None):
+        if side not in (BELOW, ABOVE):
+            raise ValueError(f"side must be '{BELOW}' or '{ABOVE}', got {side!r}")
+
+        tid = next(self._ids)
+        level = float(level)
+        self._triggers[tid] = Trigger(tid, symbol, side, level, tag, payload)
+
+        book = self._books.get((symbol, side))
+        if book is None:
+            book = self._books[(symbol, side)] = _Book(side)
+        book.add(level, tid)
+        return tid
+
+    def add_below(self, symbol, level, tag="STOP", payload=None):
+        return self.add(symbol, BELOW, level, tag, payload)
+
+    def add_above(self, symbol, level, tag="TARGET", payload=None):
+        return self.add(symbol, ABOVE, level, tag, payload)
+
+    def remove(self, tid):
+        t = self._triggers.pop(tid)
+        self._books[(t.symbol, t.side)].remove(t.level, tid)
+        return t
+
+    def move(self, tid, level):
+        """
+        Re-level a pending trigger (e.g. a trailing stop), keeping its id.
+        """
+        t = self._triggers[tid]
+        level = float(level)
+        if level == t.level:
+            return t
+
+        book = self._books[(t.symbol, t.side)]
+        book.remove(t.level, tid)
+        book.add(level, tid)
+        t = self._triggers[tid] = t._replace(level=level)
+        return t
+
+    def pending(self, symbol=None):
+        return [t for t in self._triggers.values() if symbol is None or t.symbol == symbol]
+
+    def remove_symbol(self, symbol):
+        for side in (BELOW, ABOVE):
+            book = self._books.pop((symbol, side), None)
+            if book:
+                for tid in book.ids:
+                    del self._triggers[tid]
+
+    # -----------------------------------------------------
+    # prices
+    # -----------------------------------------------------
+    def on_price(self, symbol, price):
+        """
+        Pop and return every trigger crossed by `price`.
+        """
+        fired = []
+        for side in (BELOW, ABOVE):
+            book = self._books.get((symbol, side))
+            if book:
+                fired += book.pop_crossed(price)
+
+        pop = self._triggers.pop
+        return [pop(tid) for tid in fired]
+
+    def on_prices(self, symbols, prices):
+        fired = []
+        for symbol, price in zip(symbols, prices):
+            fired += self.on_price(symbol, price)
+        return fired
+
+
+# =========================================================
+# HELPERS
+# =========================================================
+R_LEVELS = {
+    1.0: "MOVE_SL_TO_ENTRY",
+    1.5: "TRAIL_AGGRESSIVE",
+    2.0: "BOOK_PARTIAL",
+}
+
+
+def watch_position(index, symbol, entry, stop_loss, payload=None):
+    """
+    Stop plus the 1R / 1.5R / 2R action levels LiveTradeManager reports.
+    Returns the stop trigger id so a trailing SL can move() it.
+    """
+    risk = entry - stop_loss
+    for r, tag in R_LEVELS.items():
+        index.add_above(symbol, entry + r * risk, tag, payload)
+    return index.add_below(symbol, stop_loss, "STOP", payload)
+
+
+def watch_breakout(index, symbol, prev_high, atr_stop=None, payload=None):
+    """
+    PREPARE alert: breakout over the lookback high, optional ATR stop
+    (atr_stop_price) underneath.
+    """
+    ids = [index.add_above(symbol, prev_high, "BREAKOUT", payload)]
+    if atr_stop is not None:
+        ids.append(index.add_below(symbol, atr_stop, "ATR_STOP", payload))
+    return ids
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # throughput check: 500 symbols × 4 levels, 100k random prices
+    random.seed(0)
+    index = TriggerIndex()
+    syms = [f"S{i}" for i in range(500)]
+    for s in syms:
+        watch_position(index, s, 100.0, 95.0)
+
+    ticks = [(random.choice(syms), random.gauss(100, 2)) for _ in range(100_000)]
+    t0 = time.perf_counter()
+    fired = 0
+    for s, p in ticks:
+        fired += len(index.on_price(s, p))
+    dt = time.perf_counter() - t0
+    print(f"{len(ticks) / dt:,.0f} prices/sec, {fired} triggers fired, {len(index)} pending")
@@ -0,0 +1,335 @@
+import glob
+import os
+import re
+import sys
+import tarfile
+import zipfile
+
+# numpy / pandas / the process pool are imported inside the bulk and scoring
+# functions, so the Tk evaluator only pays for re when it imports the extractor
+
+# =========================================================
+# FIELDS
+# =========================================================
+# Same patterns as extract_data_from_text in "stock volume evaluate 3 data.py",
+# split into the label and the value that follows it.
+NUM = r"([\d,]+\.?\d*)"
+
+FIELDS = {
+    # key: (label, value after the label, kind)
+    "price": (r"Close\s*\*", r"\s*" + NUM, "float"),
+    "vwap": (r"VWAP", r"\s*" + NUM, "float"),
+    "upper": (r"Upper Band", r"\s*" + NUM, "float"),
+    "lower": (r"Lower Band", r"\s*" + NUM, "float"),
+    "week_return": (r"\b1W", r"\s*(-?[\d.]+)\s*%", "percent"),
+
+    "volume": (r"Traded Volume", r".*?" + NUM, "float"),
+    "value": (r"Traded Value", r".*?" + NUM, "float"),
+    "cap": (r"Total Market Cap", r".*?" + NUM, "float"),
+    "float_cap": (r"Free Float Market Cap", r".*?" + NUM, "float"),
+
+    "impact": (r"Impact cost", r"\s*" + NUM, "float"),
+    "delivery": (r"Deliverable\s*/\s*Traded\s+Quantity", r"\s+([\d.]+)\s*%", "percent"),
+    "margin": (r"Applicable Margin Rate", r"\s*" + NUM, "float"),
+
+    "daily_vol": (r"Daily Volatility", r"\s*" + NUM, "float"),
+    "annual_vol": (r"Annualised Volatility", r"\s*" + NUM, "float"),
+
+    "pe": (r"Adjusted P/E", r"\s*" + NUM, "float"),
+
+    "low52": (r"52 Week Low", r".*?" + NUM, "float"),
+    "high52": (r"52 Week High", r".*?" + NUM, "float"),
+
+    "index": (r"Index", r"\s+([A-Z0-9\s\-]+)", "string"),
+}
+
+# each label starts with a literal word; pages are searched for that word
+# with str.find on a lower-cased copy and the full pattern is only tried
+# where it occurs, so a field costs one fast substring scan
+ANCHORS = {
+    key: re.match(r"[A-Za-z0-9 /]+", label.replace(r"\b", "")).group().lower()
+    for key, (label, _, _) in FIELDS.items()
+}
+FIELD_RES = {
+    key: re.compile(label + value, re.IGNORECASE | (re.DOTALL if kind == "float" else 0))
+    for key, (label, value, kind) in FIELDS.items()
+}
+KINDS = {key: kind for key, (_, _, kind) in FIELDS.items()}
+
+# non-ASCII letters re.IGNORECASE equates with ASCII ones (İ ı ſ K);
+# str.lower() doesn't, so pages containing them use plain re.search
+_FOLD_ODD = "\u0130\u0131\u017f\u212a"
+
+
+def _convert(raw, kind):
+    if kind == "string":
+        return raw.strip()
+    if kind == "float":
+        raw = raw.replace(",", "")
+    try:
+        return float(raw.strip())
+    except ValueError:
+        return 0.0
+
+
+def extract_data_from_text(text):
+    """
+    Quote page text -> field dict (0.0 / "" for fields not found).
+    """
+    out = {key: "" if kind == "string" else 0.0 for key, kind in KINDS.items()}
+
+    if any(c in text for c in _FOLD_ODD):
+        for key, pattern in FIELD_RES.items():
+            m = pattern.search(text)
+            if m:
+                out[key] = _convert(m.group(1), KINDS[key])
+        return out
+
+    lower = text.lower()
+    for key, pattern in FIELD_RES.items():
+        anchor = ANCHORS[key]
+        pos = lower.find(anchor)
+        # a label not followed by its value is skipped, like re.search would
+        while pos != -1:
+            m = pattern.match(text, pos)
+            if m:
+                out[key] = _convert(m.group(1), KINDS[key])
+                break
+            pos = lower.find(anchor, pos + 1)
+
+    return out
+
+
+# =========================================================
+# BULK
+# =========================================================
+def _read_sources(source):
+    """
+    Directory / glob / .zip / .tar(.gz) -> [(name, text)].
+    """
+    if os.path.isdir(source):
+        source = os.path.join(source, "*.txt")
+
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as zf:
+            return [
+                (n, zf.read(n).decode("utf-8", errors="ignore"))
+                for n in zf.namelist() if n.endswith(".txt")
+            ]
+
+    if os.path.isfile(source) and tarfile.is_tarfile(source):
+        with tarfile.open(source) as tf:
+            return [
+                (m.name, tf.extractfile(m).read().decode("utf-8", errors="ignore"))
+                for m in tf.getmembers() if m.isfile() and m.name.endswith(".txt")
+            ]
+
+    pages = []
+    for path in sorted(glob.glob(source)):
+        with open(path, encoding="utf-8", errors="ignore") as f:
+            pages.append((path, f.read()))
+    return pages
+
+
+def _extract_page(item):
+    name, text = item
+    row = extract_data_from_text(text)
+    row["symbol"] = os.path.splitext(os.path.basename(name))[0]
+    return row
+
+
+def extract_pages(source, workers=None, chunksize=64):
+    """
+    Every saved quote page in `source` -> one row per page.
+    """
+    import pandas as pd
+
+    pages = _read_sources(source)
+    if not pages:
+        print(f"❌ No quote pages found in {source}")
+        return pd.DataFrame(columns=["symbol", *FIELDS])
+
+    if len(pages) < chunksize:
+        rows = [_extract_page(p) for p in pages]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(_extract_page, pages, chunksize=chunksize))
+
+    return pd.DataFrame(rows, columns=["symbol", *FIELDS])
+
+
+# =========================================================
+# SCORING (evaluate_stock, one row per symbol)
+# =========================================================
+# tag bits, same checks / wording as evaluate_stock
+LOW_IMPACT = 1 << 0
+STRONG_DELIVERY = 1 << 1
+DAILY_VOL_OK = 1 << 2
+ANNUAL_VOL_SWING = 1 << 3
+HEALTHY_FLOAT = 1 << 4
+AT_VWAP = 1 << 5
+HEALTHY_PULLBACK = 1 << 6
+AWAY_FROM_LOWER = 1 << 7
+SHARP_FALL = 1 << 8
+
+TAG_TEXT = {
+    LOW_IMPACT: "✅ Low Impact Cost",
+    STRONG_DELIVERY: "✅ Strong Delivery",
+    DAILY_VOL_OK: "✅ Daily Volatility OK",
+    ANNUAL_VOL_SWING: "✅ Annual Volatility in Swing Range",
+    HEALTHY_FLOAT: "✅ Healthy Free Float",
+    AT_VWAP: "✅ At VWAP Zone",
+    HEALTHY_PULLBACK: "✅ Healthy Pullback From High",
+    AWAY_FROM_LOWER: "✅ Away From Lower Circuit",
+    SHARP_FALL: "⚠️ Sharp Recent Fall (Wait for base)",
+}
+
+QUALITY_BITS = [LOW_IMPACT, STRONG_DELIVERY, DAILY_VOL_OK, ANNUAL_VOL_SWING, HEALTHY_FLOAT]
+STRUCTURE_BITS = [AT_VWAP, HEALTHY_PULLBACK, AWAY_FROM_LOWER]
+
+SCORE_INPUTS = [
+    "price", "vwap", "lower", "week_return", "cap", "float_cap",
+    "impact", "delivery", "daily_vol", "annual_vol", "high52",
+]
+SCORE_CACHE = "quote_scores.pkl"
+SCORE_VERSION = 2          # bump when _score changes, so old cached scores are dropped
+SCORE_COLUMNS = ["high_score", "structure_score", "final_score", "grade", "segment", "tags"]
+
+
+def tag_names(bits):
+    return [text for bit, text in TAG_TEXT.items() if bits & bit]
+
+
+def _score(df):
+    import numpy as np
+    import pandas as pd
+
+    d = {c: pd.to_numeric(df[c], errors="coerce").to_numpy(dtype=float) for c in SCORE_INPUTS}
+
+    # a zero cap / vwap / 52W high makes evaluate_stock raise; here the
+    # ratio is inf / NaN and that check simply fails
+    with np.errstate(divide="ignore", invalid="ignore"):
+        float_gap = np.abs(d["cap"] - d["float_cap"]) / d["cap"]
+        vwap_gap = np.abs(d["price"] - d["vwap"]) / d["vwap"]
+        dist_high = (d["high52"] - d["price"]) / d["high52"] * 100
+
+    checks = {
+        LOW_IMPACT: d["impact"] < 0.1,
+        STRONG_DELIVERY: d["delivery"] >= 25,
+        DAILY_VOL_OK: (d["daily_vol"] >= 2) & (d["daily_vol"] <= 5),
+        ANNUAL_VOL_SWING: (d["annual_vol"] >= 40) & (d["annual_vol"] <= 90),
+        HEALTHY_FLOAT: float_gap < 0.02,
+        AT_VWAP: vwap_gap < 0.01,
+        HEALTHY_PULLBACK: (dist_high >= 10) & (dist_high <= 30),
+        AWAY_FROM_LOWER: d["price"] > d["lower"] * 1.1,
+        SHARP_FALL: d["week_return"] < -12,
+    }
+
+    tags = np.zeros(len(df), dtype=np.int64)
+    for bit, hit in checks.items():
+        tags |= np.where(hit, bit, 0)
+
+    high_score = sum(checks[b].astype(np.int64) for b in QUALITY_BITS)
+    structure_score = sum(checks[b].astype(np.int64) for b in STRUCTURE_BITS)
+    final_score = high_score + structure_score
+
+    grade = np.select(
+        [final_score >= 7, final_score >= 5, final_score >= 3],
+        ["🔥 A+ SWING SETUP", "✅ A SWING SETUP", "⚠️ B SETUP"],
+        "❌ AVOID",
+    )
+    segment = np.select(
+        [~np.isfinite(d["cap"]), d["cap"] < 5000, d["cap"] <= 20000],
+        ["Unknown", "Small Cap", "Mid Cap"],
+        "Large Cap",
+    )
+
+    return pd.DataFrame({
+        "high_score": high_score,
+        "structure_score": structure_score,
+        "final_score": final_score,
+        "grade": grade,
+        "segment": segment,
+        "tags": tags,
+    }, index=df.index)
+
+
+class ScoreCache:
+    """
+    Scores keyed by the hash of each row's inputs, optionally kept on disk
+    (pickle) so a nightly run only scores symbols whose metrics changed.
+    Each score_table() call keeps just the hashes of the rows it scored.
+    """
+
+    def __init__(self, path=None):
+        import pandas as pd
+
+        self.path = path
+        self.table = pd.DataFrame(columns=SCORE_COLUMNS, index=pd.Index([], dtype="uint64"))
+        if path and os.path.exists(path):
+            table = pd.read_pickle(path)
+            if table.attrs.get("version") == SCORE_VERSION:
+                self.table = table
+
+    def save(self):
+        if self.path:
+            self.table.attrs["version"] = SCORE_VERSION
+            tmp = f"{self.path}.tmp"
+            self.table.to_pickle(tmp)
+            os.replace(tmp, self.path)
+
+
+def row_hashes(df):
+    import pandas as pd
+
+    inputs = df[SCORE_INPUTS].apply(pd.to_numeric, errors="coerce")
+    return pd.util.hash_pandas_object(inputs, index=False).to_numpy()
+
+
+def score_table(df, cache=None):
+    """
+    evaluate_stock over a table of extracted metrics (extract_pages output).
+    Returns df plus high_score, structure_score, final_score, grade,
+    segment and the tags bitset (decode with tag_names), best first.
+    """
+    import pandas as pd
+
+    if cache is None:
+        scores = _score(df)
+    else:
+        keys = row_hashes(df)
+        table = cache.table
+        miss = ~pd.Index(keys).isin(table.index)
+        if miss.any():
+            fresh = _score(df[miss])
+            fresh.index = keys[miss]
+            fresh = fresh[~fresh.index.duplicated()]
+            table = pd.concat([table, fresh]) if len(table) else fresh
+
+        # keep only this run's rows, so changed / dropped symbols don't pile up
+        stale = ~table.index.isin(keys)
+        if miss.any() or stale.any():
+            cache.table = table[~stale]
+            cache.save()
+        scores = cache.table.loc[keys].set_axis(df.index)
+
+    out = df.join(scores)
+    return out.sort_values(["final_score", "high_score"], ascending=False, kind="stable")
+
+
+if __name__ == "__main__":
+    # python quote_pages.py <folder | glob | archive> [out.csv | out.parquet]
+    if len(sys.argv) < 2:
+        print("usage: python quote_pages.py <folder|glob|archive> [out.csv|out.parquet]")
+        sys.exit(1)
+
+    table = score_table(extract_pages(sys.argv[1]), ScoreCache(SCORE_CACHE))
+    out = sys.argv[2] if len(sys.argv) > 2 else "quote_pages.csv"
+
+    if out.endswith(".parquet"):
+        table.to_parquet(out, index=False)
+    else:
+        table.to_csv(out, index=False)
+    print(f"✅ {len(table)} quote pages scored → {out}")
@@ -206,87 +206,125 @@
 #=================================================================================================
 
 import pandas as pd
+import numpy as np
 import glob
+import heapq
 import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
 
-def clean_num(x):
-    s = str(x).replace(",", "").strip()
-    if s in ("", "-", "NA", "nan", "None"):
-        return None
-    try:
-        return float(s)
-    except:
-        return None
-
-
-def run_screener_on_df(df, source_file=""):
-    df = df.rename(columns={
-        "SYMBOL \n": "symbol",
-        "LTP \n": "price",
-        "VALUE \n (₹ Crores)": "value_cr",
-        "%CHNG \n": "day_change",
-        "52W H \n": "high52",
-        "52W L \n": "low52"
-    })
-
-    for col in ["price", "value_cr", "day_change", "high52", "low52"]:
-        if col in df.columns:
-            df[col] = df[col].apply(clean_num)
-
-    df = df.dropna(subset=["symbol", "price", "value_cr", "day_change", "high52", "low52"])
-
-    results = []
-
-    for _, r in df.iterrows():
-        symbol = str(r["symbol"]).strip()
-        price = r["price"]
-        value = r["value_cr"]
-        change = r["day_change"]
-        high52 = r["high52"]
-        low52 = r["low52"]
+# snapshot cleaning + screen expressions are shared with trading_system
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "trading_system"))
+from core.screen_engine import (
+    DEFAULT_SCREEN, clean_num, clean_num_col, prepare_snapshot, range_fields,
+    ScreenExpr, compile_expr, evaluate_screens, run_screens_on_df, symbol_from_path,
+)
 
-        # 🟦 1) Liquidity filter
-        if value < 300:
-            continue
+def run_screener_on_df(df, source_file="", screen=DEFAULT_SCREEN, derived=None):
+    df = prepare_snapshot(df)
+    mask = evaluate_screens(df, {"screen": screen}, derived)["screen"]
 
-        # 🟦 2) Price filter (avoid penny / junk)
-        if price < 50:
-            continue
+    out = df.loc[mask, ["symbol", "price", "value_cr", "day_change", "pullback", "range_pos"]]
+    out = out.rename(columns={"value_cr": "value", "day_change": "change"})
+    out.insert(0, "source_file", os.path.basename(source_file))
 
-        # 🟦 3) Momentum filter (avoid weak green days)
-        if change < 1.0:
-            continue
+    return out.reset_index(drop=True)
 
-        # 🟦 4) Pullback from 52W High
-        pullback = (high52 - price) / high52 * 100
-        if pullback < 5 or pullback > 35:
-            continue
 
-        # 🟦 5) Range position filter (avoid broken stocks)
-        # (how strong stock is inside yearly range)
-        if (high52 - low52) <= 0:
-            continue
-
-        range_pos = (price - low52) / (high52 - low52) * 100
+def print_candidates(results, top_n):
+    print(f"\n📌 FINAL SWING CANDIDATES (Top {top_n})\n")
+    print(f"{'SourceFile':25} {'Symbol':12} {'Price':>10} {'ValueCr':>10} {'Day%':>8} {'Pullback%':>12} {'Range%':>10}")
 
-        # keep only strong zone stocks
-        if range_pos < 40:
-            continue
+    for r in results.itertuples(index=False):
+        print(f"{r.source_file[:25]:25} "
+              f"{r.symbol[:12]:12} "
+              f"{r.price:10.2f} "
+              f"{r.value:10.2f} "
+              f"{r.change:8.2f} "
+              f"{r.pullback:12.2f} "
+              f"{r.range_pos:10.2f}")
+
+
+def _screen_file_top(file, top_n, key, screen):
+    """
+    Worker: screen one file and keep only its own best top_n rows.
+    """
+    df = pd.read_csv(file)
+    res = run_screener_on_df(df, source_file=file, screen=screen)
+    return len(res), res.nlargest(top_n, key)
+
+
+def run_screener_streaming(folder_pattern="csv file/*.csv", top_n=50, key="value", workers=None,
+                           screen=DEFAULT_SCREEN):
+    """
+    Streaming top-N: files are screened in parallel and merged into a
+    bounded heap as they finish, so memory stays O(top_n) no matter how
+    many snapshot files are read.
+    """
+    heap = []
+    seq = 0
+    columns = None
+    files = glob.iglob(folder_pattern)
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # at most 2 files per worker in flight, so pending results (and the
+        # file list itself) never grow with the number of snapshots
+        window = 2 * workers
+        futures = {}
+
+        def refill():
+            for file in islice(files, window - len(futures)):
+                futures[pool.submit(_screen_file_top, file, top_n, key, screen)] = file
+
+        refill()
+        if not futures:
+            print("❌ No CSV files found.")
+            return
+
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for fut in done:
+                file = futures.pop(fut)  # drop the ref so finished results can be freed
+                try:
+                    found, res = fut.result()
+                except Exception as e:
+                    print(f"❌ Error in {file}: {e}")
+                    continue
+
+                if found:
+                    print(f"✅ {os.path.basename(file)} → {found} candidates")
+                else:
+                    print(f"⚠️ {os.path.basename(file)} → No candidates")
+
+                columns = list(res.columns)
+                for row, k in zip(res.itertuples(index=False, name=None), res[key].to_numpy()):
+                    # -seq: on equal keys the later entry is evicted first
+                    item = (k, -seq, row)
+                    seq += 1
+                    if len(heap) < top_n:
+                        heapq.heappush(heap, item)
+                    elif item > heap[0]:
+                        heapq.heapreplace(heap, item)
+            refill()
+
+    if not heap:
+        print("\nNo swing candidates found in any file.")
+        return
 
-        results.append({
-            "source_file": os.path.basename(source_file),
-            "symbol": symbol,
-            "price": price,
-            "value": value,
-            "change": change,
-            "pullback": pullback,
-            "range_pos": range_pos
-        })
+    rows = [row for _, _, row in sorted(heap, reverse=True)]
+    return pd.DataFrame(rows, columns=columns)
 
-    return results
 
+def run_screener_multiple_files(folder_pattern="csv file/*.csv", top_n=50, stream=False, workers=None,
+                                screen=DEFAULT_SCREEN):
+    if stream:
+        results = run_screener_streaming(folder_pattern, top_n=top_n, workers=workers, screen=screen)
+        if results is not None:
+            print_candidates(results, top_n)
+        return results
 
-def run_screener_multiple_files(folder_pattern="csv file/*.csv", top_n=50):
     csv_files = glob.glob(folder_pattern)
 
     if not csv_files:
@@ -298,38 +336,189 @@ def run_screener_multiple_files(folder_pattern="csv file/*.csv", top_n=50):
     for file in csv_files:
         try:
             df = pd.read_csv(file)
-            res = run_screener_on_df(df, source_file=file)
+            res = run_screener_on_df(df, source_file=file, screen=screen)
 
-            if res:
+            if len(res):
                 print(f"✅ {os.path.basename(file)} → {len(res)} candidates")
             else:
                 print(f"⚠️ {os.path.basename(file)} → No candidates")
 
-            all_results.extend(res)
+            all_results.append(res)
 
         except Exception as e:
             print(f"❌ Error in {file}: {e}")
 
-    if not all_results:
+    all_results = pd.concat(all_results, ignore_index=True) if all_results else pd.DataFrame()
+
+    if all_results.empty:
         print("\nNo swing candidates found in any file.")
         return
 
     # sort by liquidity
-    all_results = sorted(all_results, key=lambda x: x["value"], reverse=True)
+    all_results = all_results.sort_values("value", ascending=False, kind="stable").head(top_n)
 
-    all_results = all_results[:top_n]
+    print_candidates(all_results, top_n)
+    return all_results
 
-    print(f"\n📌 FINAL SWING CANDIDATES (Top {top_n})\n")
-    print(f"{'SourceFile':25} {'Symbol':12} {'Price':>10} {'ValueCr':>10} {'Day%':>8} {'Pullback%':>12} {'Range%':>10}")
 
-    for r in all_results:
-        print(f"{r['source_file'][:25]:25} "
-              f"{r['symbol'][:12]:12} "
-              f"{r['price']:10.2f} "
-              f"{r['value']:10.2f} "
-              f"{r['change']:8.2f} "
-              f"{r['pullback']:12.2f} "
-              f"{r['range_pos']:10.2f}")
+# =========================================================
+# POINT-IN-TIME HISTORICAL SCREENING
+# =========================================================
+# Rebuilds the snapshot fields (52W H/L, traded value, day change,
+# range position) for every date from per-symbol Quote-Equity histories,
+# then runs the same screen expressions over all dates at once.
+
+HISTORY_WINDOW = 252           # trading days in 52 weeks
+
+
+def rolling_extreme(a, window, fn=np.fmax):
+    """
+    Trailing rolling max (fn=np.fmax) or min (fn=np.fmin) along axis 0.
+
+    van Herk / Gil-Werman: one prefix and one suffix scan per block of
+    `window` rows, so O(n) regardless of window size. NaN is skipped and
+    the first window-1 rows use whatever history exists.
+    """
+    a = np.asarray(a, dtype=float)
+    n = a.shape[0]
+    if n == 0:
+        return a.copy()
+
+    blocks = -(-n // window)
+    pad = blocks * window - n
+    padded = np.concatenate([a, np.full((pad,) + a.shape[1:], np.nan)])
+    shaped = padded.reshape((blocks, window) + a.shape[1:])
+
+    prefix = fn.accumulate(shaped, axis=1).reshape(padded.shape)[:n]
+    suffix = fn.accumulate(shaped[:, ::-1], axis=1)[:, ::-1].reshape(padded.shape)[:n]
+
+    out = prefix.copy()
+    if n >= window:
+        out[window - 1:] = fn(suffix[:n - window + 1], prefix[window - 1:])
+    return out
+
+
+def load_history(file):
+    """
+    One Quote-Equity-* history as date / high / low / close / volume / value.
+    """
+    df = pd.read_csv(file, encoding="utf-8-sig")
+    df.columns = [c.strip().upper() for c in df.columns]
+
+    df["DATE"] = pd.to_datetime(df["DATE"], format="%d-%b-%Y", errors="coerce")
+    for col in ["HIGH", "LOW", "CLOSE", "VOLUME", "VALUE"]:
+        if col in df.columns:
+            df[col] = clean_num_col(df[col])
+
+    if "VALUE" not in df.columns:
+        df["VALUE"] = df["CLOSE"] * df["VOLUME"]
+
+    df = df.dropna(subset=["DATE", "HIGH", "LOW", "CLOSE"])
+    df = df.drop_duplicates("DATE", keep="last").sort_values("DATE")
+
+    return df[["DATE", "HIGH", "LOW", "CLOSE", "VALUE"]]
+
+
+def build_history_panel(files):
+    """
+    Align per-symbol histories into date x symbol arrays.
+    """
+    frames = []
+    for file in files:
+        symbol = symbol_from_path(file)
+
+        try:
+            h = load_history(file)
+        except Exception as e:
+            print(f"❌ Error in {file}: {e}")
+            continue
+
+        h["SYMBOL"] = symbol
+        frames.append(h)
+
+    if not frames:
+        return None
+
+    long = pd.concat(frames, ignore_index=True)
+    wide = long.pivot_table(index="DATE", columns="SYMBOL", values=["HIGH", "LOW", "CLOSE", "VALUE"],
+                            aggfunc="last")
+
+    dates = wide.index
+    symbols = wide["CLOSE"].columns
+    panel = {col: wide[col].reindex(columns=symbols).to_numpy(dtype=float) for col in ["HIGH", "LOW", "CLOSE", "VALUE"]}
+
+    return dates, symbols, panel
+
+
+def history_fields(panel, window=HISTORY_WINDOW):
+    """
+    Snapshot-equivalent fields for every (date, symbol) of the panel.
+    """
+    close = panel["CLOSE"]
+    prev_close = np.vstack([np.full((1, close.shape[1]), np.nan), close[:-1]])
+
+    high52 = rolling_extreme(panel["HIGH"], window, np.fmax)
+    low52 = rolling_extreme(panel["LOW"], window, np.fmin)
+
+    # gaps (symbol not listed yet / missing day) must not carry a 52W value
+    high52[np.isnan(close)] = np.nan
+    low52[np.isnan(close)] = np.nan
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        day_change = (close / prev_close - 1) * 100
+
+    pullback, range_pos = range_fields(close, high52, low52)
+
+    return {
+        "price": close,
+        "value_cr": panel["VALUE"] / 1e7,       # ₹ → ₹ Crores (matches MW-* snapshots)
+        "day_change": day_change,
+        "high52": high52,
+        "low52": low52,
+        "pullback": pullback,
+        "range_pos": range_pos,
+    }
+
+
+def run_historical_screen(folder_pattern="csv file/Quote-Equity-*.csv", screens=None, derived=None,
+                          window=HISTORY_WINDOW, horizons=(5, 20), hits_only=True):
+    """
+    Evaluate screens for every date of the per-symbol history in one pass.
+
+    Returns a long DataFrame (date, symbol, fields, one bool column per
+    screen, fwd_ret_<h> forward close-to-close returns in %) so screen
+    outcomes can be backtested directly.
+    """
+    screens = screens or {"screen": DEFAULT_SCREEN}
+
+    built = build_history_panel(sorted(glob.glob(folder_pattern)))
+    if built is None:
+        print("❌ No CSV files found.")
+        return
+
+    dates, symbols, panel = built
+    fields = history_fields(panel, window)
+
+    close = panel["CLOSE"]
+    for h in horizons:
+        fwd = np.full_like(close, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fwd[:-h] = (close[h:] / close[:-h] - 1) * 100
+        fields[f"fwd_ret_{h}"] = fwd
+
+    valid = ~np.isnan(close).ravel()
+    long = pd.DataFrame({name: arr.ravel()[valid] for name, arr in fields.items()})
+    long.insert(0, "symbol", np.tile(np.asarray(symbols), len(dates))[valid])
+    long.insert(0, "date", np.repeat(np.asarray(dates), len(symbols))[valid])
+
+    masks = evaluate_screens(long, screens, derived)
+    long = pd.concat([long, masks], axis=1)
+
+    if hits_only:
+        long = long[masks.any(axis=1)]
+
+    return long.reset_index(drop=True)
 
 
-run_screener_multiple_files("csv file/*.csv", top_n=500)
+if __name__ == "__main__":
+    run_screener_multiple_files("csv file/*.csv", top_n=500)
@@ -233,67 +233,11 @@
 
 import tkinter as tk
 from tkinter import messagebox
-import re
 
-# ----------------- Parsing Helpers -----------------
-
-def extract_float(text, pattern):
-    match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-    if match:
-        value = match.group(1).replace(",", "").strip()
-        try:
-            return float(value)
-        except:
-            return 0.0
-    return 0.0
-
-
-def extract_percent(text, pattern):
-    match = re.search(pattern, text, re.IGNORECASE)
-    if match:
-        try:
-            return float(match.group(1).strip())
-        except:
-            return 0.0
-    return 0.0
-
-def extract_string(text, pattern):
-    match = re.search(pattern, text, re.IGNORECASE)
-    if match:
-        return match.group(1).strip()
-    return ""
-
-# ----------------- Auto Extract -----------------
-
-def extract_data_from_text(text):
-    return {
-        "price": extract_float(text, r"Close\s*\*\s*([\d,]+\.?\d*)"),
-        "vwap": extract_float(text, r"VWAP\s*([\d,]+\.?\d*)"),
-        "upper": extract_float(text, r"Upper Band\s*([\d,]+\.?\d*)"),
-        "lower": extract_float(text, r"Lower Band\s*([\d,]+\.?\d*)"),
-        "week_return": extract_percent(text, r"\b1W\s*(-?[\d.]+)\s*%"),
-
-        # already strict (kept same style)
-        "volume": extract_float(text, r"Traded Volume.*?([\d,]+\.?\d*)"),
-        "value": extract_float(text, r"Traded Value.*?([\d,]+\.?\d*)"),
-        "cap": extract_float(text, r"Total Market Cap.*?([\d,]+\.?\d*)"),
-        "float_cap": extract_float(text, r"Free Float Market Cap.*?([\d,]+\.?\d*)"),
-
-        "impact": extract_float(text, r"Impact cost\s*([\d,]+\.?\d*)"),
-        "delivery": extract_percent(text, r"Deliverable\s*/\s*Traded\s+Quantity\s+([\d.]+)\s*%"),
-        "margin": extract_float(text, r"Applicable Margin Rate\s*([\d,]+\.?\d*)"),
-
-        "daily_vol": extract_float(text, r"Daily Volatility\s*([\d,]+\.?\d*)"),
-        "annual_vol": extract_float(text, r"Annualised Volatility\s*([\d,]+\.?\d*)"),
-
-        "pe": extract_float(text, r"Adjusted P/E\s*([\d,]+\.?\d*)"),
-
-        "low52": extract_float(text, r"52 Week Low.*?([\d,]+\.?\d*)"),
-        "high52": extract_float(text, r"52 Week High.*?([\d,]+\.?\d*)"),
-
-        "index": extract_string(text, r"Index\s+([A-Z0-9\s\-]+)")
-    }
+import pandas as pd
 
+# Tk-free extractor and scorer (also used for bulk runs, see quote_pages.py)
+from quote_pages import extract_data_from_text, score_table, tag_names
 
 def populate_fields():
     data = extract_data_from_text(input_box.get("1.0", tk.END))
@@ -303,90 +247,30 @@ def populate_fields():
 
 # ----------------- Core Logic -----------------
 
-def get_market_cap_segment(market_cap):
-    if market_cap < 5000:
-        return "Small Cap"
-    elif market_cap <= 20000:
-        return "Mid Cap"
-    else:
-        return "Large Cap"
+# thresholds / grades live in quote_pages._score, shared with the bulk runs
+GRADE_COLORS = {
+    "🔥 A+ SWING SETUP": "green",
+    "✅ A SWING SETUP": "orange",
+    "⚠️ B SETUP": "brown",
+    "❌ AVOID": "red",
+}
 
 def evaluate_stock():
     try:
         d = {k: float(entries[k].get()) if k not in ["index"] else entries[k].get() for k in entries}
-
-        segment = get_market_cap_segment(d["cap"])
-        high_score = 0
-        structure_score = 0
-        tags = []
-
-        # ---------- Quality Layer ----------
-        if d["impact"] < 0.1:
-            high_score += 1
-            tags.append("✅ Low Impact Cost")
-
-        if d["delivery"] >= 25:
-            high_score += 1
-            tags.append("✅ Strong Delivery")
-
-        if 2 <= d["daily_vol"] <= 5:
-            high_score += 1
-            tags.append("✅ Daily Volatility OK")
-
-        if 40 <= d["annual_vol"] <= 90:
-            high_score += 1
-            tags.append("✅ Annual Volatility in Swing Range")
-
-        if abs(d["cap"] - d["float_cap"]) / d["cap"] < 0.02:
-            high_score += 1
-            tags.append("✅ Healthy Free Float")
-
-        # ---------- Structure Layer ----------
-        # VWAP
-        if abs(d["price"] - d["vwap"]) / d["vwap"] < 0.01:
-            structure_score += 1
-            tags.append("✅ At VWAP Zone")
-
-        # 52W Pullback
-        dist_high = (d["high52"] - d["price"]) / d["high52"] * 100
-        if 10 <= dist_high <= 30:
-            structure_score += 1
-            tags.append("✅ Healthy Pullback From High")
-
-        # Circuit Safety
-        if d["price"] > d["lower"] * 1.1:
-            structure_score += 1
-            tags.append("✅ Away From Lower Circuit")
-
-        # Crash Detection
-        if d["week_return"] < -12:
-            tags.append("⚠️ Sharp Recent Fall (Wait for base)")
-
-        # ---------- Final Decision ----------
-        final_score = high_score + structure_score
-
-        if final_score >= 7:
-            result = "🔥 A+ SWING SETUP"
-            color = "green"
-        elif final_score >= 5:
-            result = "✅ A SWING SETUP"
-            color = "orange"
-        elif final_score >= 3:
-            result = "⚠️ B SETUP"
-            color = "brown"
-        else:
-            result = "❌ AVOID"
-            color = "red"
-
-        tags.append(f"Market Cap: {segment}")
-        tags.append(f"52W Range: ₹{d['low52']} - ₹{d['high52']}")
-        tags.append(f"Index: {d['index']}")
-
-        label_result.config(text=result, fg=color)
-        label_tags.config(text="\n".join(tags))
-
-    except:
+    except ValueError:
         messagebox.showerror("Error", "Invalid numeric values")
+        return
+
+    row = score_table(pd.DataFrame([d])).iloc[0]
+
+    tags = tag_names(row["tags"])
+    tags.append(f"Market Cap: {row['segment']}")
+    tags.append(f"52W Range: ₹{d['low52']} - ₹{d['high52']}")
+    tags.append(f"Index: {d['index']}")
+
+    label_result.config(text=row["grade"], fg=GRADE_COLORS[row["grade"]])
+    label_tags.config(text="\n".join(tags))
 
 # # ----------------- GUI -----------------
 #
@@ -1,5 +1,63 @@
 CAPITAL = 3000
 RISK_PER_TRADE = 0.005   # 0.5%
 RISK_RS = CAPITAL * RISK_PER_TRADE
+MAX_TRADE_EXPOSURE_PCT = 20   # % of capital in one position
+MAX_SECTOR_EXPOSURE_PCT = 30  # % of capital in one sector
+MAX_PORTFOLIO_RISK_PCT = 2.0  # total open risk across today's allocation
+MIN_FILL_PCT = 25             # drop allocations trimmed below this % of their per-trade size
+TARGET_R = 2.0                # default target when a candidate has none
 
 TIMEFRAME = "D"
+
+# ⏱️ per-stage timing / memory report (near-zero cost when off)
+PROFILE = False
+
+# 🟦 extra snapshot screens, same expression language as core.screen_engine;
+# the "swing" screen (core.screen_engine.DEFAULT_SCREEN) always runs
+SCREENS = {}
+
+# 👀 watch-folder service
+WATCH_DIRS = ["data/indices", "data/sectors", "data/stocks", "data/backtests", "../csv file"]
+WATCH_PATTERNS = ["MW-*.csv", "Quote-Equity-*.csv", "backtest_trades*.csv"]
+WATCH_POLL_SECS = 0.2
+WATCH_DEBOUNCE_SECS = 0.3
+
+RESULTS_DIR = "results"
+STORE_MEMO_TABLES = 16       # tables memoised per process (disk is the shared copy)
+LEADER_RETRY_SECS = 5        # follower workers retry the refresher lock this often
+
+# 📊 engine inputs (main.py + dashboard)
+SYSTEM_INPUTS = {
+    "nifty_path": "data/indices/MW-NIFTY-50-01-Feb-2026.csv",
+    "sector_paths": {
+        "IT": "data/sectors/MW-NIFTY-IT-01-Feb-2026.csv"
+    },
+    "stock_paths": {
+        "IT": {
+            "TCS": "data/stocks/Quote-Equity-TCS--01-02-2025-01-02-2026.csv"
+        }
+    },
+}
+
+# 🖥️ dashboard
+DASH_REFRESH_SECS = 300      # recompute at least this often
+DASH_POLL_MS = 2000          # client poll for fresh results
+DASH_PAGE_SIZE = 50          # rows serialised per DataTable page
+CHART_MAX_POINTS = 1000      # candles per rendered chart view
+ATR_STOP_MULT = 1.5          # ATR stop = close - ATR × mult
+
+# ⏯️ replay feed (stand-in for a broker feed)
+REPLAY_PATHS = ["data/stocks/*.csv", "../csv file/Quote-Equity-*.csv"]
+REPLAY_SPEED = 0             # 0 = as fast as possible, 1 = real time, 100 = 100×
+REPLAY_BAR_SECS = 86400      # wall-clock span of one bar at 1× (daily bars)
+REPLAY_QUEUE_SIZE = 1024     # per-subscriber queue, full queues back-pressure the feed
+
+# 🔗 correlation-aware risk budgeting
+COV_WINDOW = 60              # bars of daily returns in the rolling covariance
+COV_SHRINKAGE = 0.2          # pull towards the diagonal (0 = sample, 1 = independent)
+COV_MIN_SCALE = 0.25         # never cut a candidate below this share of a risk unit
+
+# 🎚️ backtest sizing: "fixed" = RISK_RS per trade, "vol_target" = equal volatility per position
+SIZING_MODE = "fixed"
+VOL_TARGET_PCT = 0.25        # daily ₹ volatility per position, % of capital
+VOL_LOOKBACK = 20            # bars of returns for realized volatility
@@ -0,0 +1,137 @@
+from math import floor
+
+import numpy as np
+import pandas as pd
+
+from config import (
+    CAPITAL, RISK_PER_TRADE, MAX_TRADE_EXPOSURE_PCT, MAX_SECTOR_EXPOSURE_PCT,
+    MAX_PORTFOLIO_RISK_PCT, MIN_FILL_PCT, TARGET_R, ATR_STOP_MULT,
+)
+from core.covariance import correlation_scale
+from core.indicators import atr
+from core.position_sizing import size_batch
+from utils.loader import load_csv_cached as load_csv
+
+def system_candidates(results, stock_paths, stop_mult=ATR_STOP_MULT, target_r=TARGET_R):
+    """
+    run_system() output -> candidate frame (ATR stop, target at target_r).
+    """
+    sector_of = {stock: sector for sector, stocks in stock_paths.items() for stock in stocks}
+
+    rows = []
+    for r in results if isinstance(results, list) else []:
+        sector = sector_of[r["stock"]]
+        df = load_csv(stock_paths[sector][r["stock"]])
+
+        entry = df["close"].iloc[-1]
+        stop = entry - stop_mult * atr(df).iloc[-1]
+        rows.append({
+            "symbol": r["stock"],
+            "sector": sector,
+            "strategy": r["strategy"],
+            "entry": entry,
+            "stop": stop,
+            "target": entry + target_r * (entry - stop),
+        })
+
+    return pd.DataFrame(rows, columns=["symbol", "sector", "strategy", "entry", "stop", "target"])
+
+def allocate(candidates, capital=CAPITAL, cash=None,
+             risk_per_trade=RISK_PER_TRADE,
+             max_total_risk_pct=MAX_PORTFOLIO_RISK_PCT,
+             max_trade_exp_pct=MAX_TRADE_EXPOSURE_PCT,
+             max_sector_exp_pct=MAX_SECTOR_EXPOSURE_PCT,
+             min_fill_pct=MIN_FILL_PCT,
+             cov=None):
+    """
+    Joint allocation of today's candidates.
+
+    Maximises expected R (expected_r column, else reward:risk from target)
+    per rupee of risk, subject to per-trade risk, total risk budget,
+    per-trade / per-sector exposure and available cash. Candidates are
+    filled best-first; with only the risk budget binding this is the
+    optimal (fractional knapsack) order, and the other caps just trim qty.
+    A position trimmed below min_fill_pct of its per-trade size is dropped
+    (binding "below_min_size") so a spent budget doesn't leave 1-share stubs.
+    Sector caps only apply to candidates with a known sector.
+
+    With a RollingCovariance, each candidate's per-trade risk is scaled by
+    correlation_scale() first, so correlated setups share a risk unit.
+
+    Returns the candidates with qty, risk_rs, investment and the
+    constraint that limited each row ("binding").
+    """
+    df = candidates.reset_index(drop=True)
+    cash = capital if cash is None else cash
+
+    risk_scale = np.ones(len(df))
+    if cov is not None:
+        risk_scale = correlation_scale(cov, df["symbol"])
+    risk_per_trade = risk_per_trade * risk_scale
+
+    # per-trade risk + per-trade exposure, vectorized
+    sized = size_batch(
+        df["entry"], df["stop"], df.get("target"),
+        capital=capital, risk_pct=risk_per_trade * 100,
+        max_trade_exp_pct=max_trade_exp_pct,
+    )
+
+    expected_r = df["expected_r"] if "expected_r" in df.columns else sized.get("rr")
+    if expected_r is None:
+        raise ValueError("candidates need a 'target' or 'expected_r' column")
+    expected_r = np.nan_to_num(np.asarray(expected_r, dtype=float), nan=-np.inf)
+
+    entry = df["entry"].to_numpy(dtype=float)
+    rps = sized["risk_per_share"].to_numpy()
+    cap_qty = sized["qty"].to_numpy()
+    cap_reason = np.where(sized["exposure_clamped"], "trade_exposure", "trade_risk").tolist()
+    # unknown sector -> no sector cap for that row
+    sectors = df["sector"].to_numpy() if "sector" in df.columns else np.full(len(df), None)
+
+    qty = np.zeros(len(df), dtype=np.int64)
+    binding = np.full(len(df), "", dtype=object)
+
+    risk_left = capital * max_total_risk_pct / 100
+    cash_left = float(cash)
+    sector_cap = capital * max_sector_exp_pct / 100
+    sector_left = {}
+
+    order = np.argsort(-expected_r, kind="stable")
+    for i in order:
+        if not (expected_r[i] > 0) or cap_qty[i] == 0:
+            binding[i] = "not_eligible"
+            continue
+
+        e, r = entry[i], rps[i]
+        sector = sectors[i] if pd.notna(sectors[i]) else None
+        s_left = sector_left.get(sector, sector_cap) if sector is not None else np.inf
+
+        limits = (
+            (cap_qty[i], cap_reason[i]),
+            (floor(risk_left / r), "risk_budget"),
+            (floor(cash_left / e), "cash"),
+            (floor(s_left / e) if sector is not None else cap_qty[i], "sector_exposure"),
+        )
+        q, reason = min(limits, key=lambda x: x[0])
+        q = max(q, 0)
+
+        if q < max(1, cap_qty[i] * min_fill_pct / 100):
+            binding[i] = "below_min_size"
+            continue
+
+        qty[i] = q
+        binding[i] = reason
+        risk_left -= q * r
+        cash_left -= q * e
+        if sector is not None:
+            sector_left[sector] = s_left - q * e
+
+    out = df.copy()
+    out["expected_r"] = expected_r
+    out["risk_scale"] = risk_scale
+    out["qty"] = qty
+    out["risk_rs"] = qty * rps
+    out["investment"] = qty * entry
+    out["exposure_pct"] = out["investment"] / capital * 100
+    out["binding"] = binding
+    return out
@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+
+from config import CAPITAL
+
+# backtest_trades.csv / core.backtester column -> normalised name
+TRADE_COLUMNS = {
+    "EntryDate": "entry_date",
+    "EntryPrice": "entry",
+    "EntryReason": "entry_reason",
+    "ExitDate": "exit_date",
+    "ExitPrice": "exit",
+    "Result": "result",
+    "ReturnPct": "return_pct",
+    "ExitReason": "exit_reason",
+    "date": "entry_date",
+}
+
+AGGREGATES = ["by_entry_reason", "by_exit_reason", "monthly", "equity"]
+
+
+def normalize_trades(trades):
+    """
+    Trade log (DataFrame or core.backtester list of dicts) -> common columns.
+    """
+    df = pd.DataFrame(trades).rename(columns=TRADE_COLUMNS)
+
+    for col in ["entry_date", "exit_date"]:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors="coerce")
+    if "exit_date" not in df.columns:
+        df["exit_date"] = df["entry_date"]
+
+    if "return_pct" not in df.columns:
+        df["return_pct"] = (df["exit"] / df["entry"] - 1) * 100
+
+    for col in ["entry_reason", "exit_reason"]:
+        if col not in df.columns:
+            df[col] = "N/A"
+
+    return df.sort_values("exit_date", kind="stable").reset_index(drop=True)
+
+
+def _reason_stats(df, col):
+    win = df["return_pct"] > 0
+    g = df.assign(win=win).groupby(col, sort=False)
+
+    out = g.agg(
+        trades=("return_pct", "size"),
+        win_rate=("win", "mean"),
+        avg_return_pct=("return_pct", "mean"),
+        total_return_pct=("return_pct", "sum"),
+    )
+    out["win_rate"] *= 100
+    return out.reset_index().sort_values("trades", ascending=False)
+
+
+def trade_aggregates(trades):
+    """
+    All dashboard aggregates for one run, computed in one go.
+    """
+    df = normalize_trades(trades)
+    r = df["return_pct"].to_numpy(dtype=float) / 100
+
+    # equity: rupee P&L when the log has it, otherwise compound returns
+    if "pnl" in df.columns:
+        equity = CAPITAL + df["pnl"].cumsum().to_numpy(dtype=float)
+    else:
+        equity = CAPITAL * np.cumprod(1 + r)
+
+    peak = np.maximum.accumulate(np.maximum(equity, CAPITAL))
+    curve = pd.DataFrame({
+        "date": df["exit_date"],
+        "equity": equity,
+        "drawdown_pct": (equity / peak - 1) * 100,
+    })
+
+    month = df["exit_date"].dt.to_period("M")
+    monthly = (
+        pd.DataFrame({"month": month, "g": 1 + r})
+        .groupby("month")["g"].prod()
+        .sub(1).mul(100)
+        .rename("return_pct")
+        .reset_index()
+    )
+    monthly["month"] = monthly["month"].astype(str)
+
+    return {
+        "by_entry_reason": _reason_stats(df, "entry_reason"),
+        "by_exit_reason": _reason_stats(df, "exit_reason"),
+        "monthly": monthly,
+        "equity": curve,
+    }
+
+
+# =========================================================
+# PER-RUN CACHE IN THE RESULT STORE
+# =========================================================
+def _table(run_id, name):
+    return f"bt_{run_id}__{name}"
+
+
+def save_run(store, run_id, trades):
+    """
+    Store a run's trades and its precomputed aggregates. Readers only ever
+    load the aggregate tables, nothing is re-aggregated on view.
+    """
+    store.put(_table(run_id, "trades"), normalize_trades(trades))
+    for name, df in trade_aggregates(trades).items():
+        store.put(_table(run_id, name), df)
+
+
+def run_ids(store):
+    return sorted({n[3:].rsplit("__", 1)[0] for n in store.names() if n.startswith("bt_")})
+
+
+def load_run(store, run_id):
+    return {name: store.get(_table(run_id, name)) for name in AGGREGATES}
@@ -1,23 +1,73 @@
-from core.indicators import atr
+from math import floor
+
+import numpy as np
+import pandas as pd
+
+from config import (
+    CAPITAL, SIZING_MODE, VOL_TARGET_PCT, VOL_LOOKBACK, MAX_TRADE_EXPOSURE_PCT,
+)
+from core.indicators import atr, atr_wilder, realized_vol
 from core.position_sizing import position_size
+from utils.loader import load_csv_cached, symbol_from_path
+from utils.profiler import span
+
+SIZING_MODES = ("fixed", "vol_target")
+
+def vol_target_size(entry, daily_vol, capital=CAPITAL, target_pct=VOL_TARGET_PCT):
+    """
+    qty so that qty × entry × daily_vol ≈ target_pct of capital,
+    capped at the max trade exposure.
+    """
+    if not daily_vol > 0:
+        return 0
+
+    qty = floor(capital * target_pct / 100 / (entry * daily_vol))
+    cap = floor(capital * MAX_TRADE_EXPOSURE_PCT / 100 / entry)
+    return max(min(qty, cap), 0)
+
+def backtest(df, strategy_fn, sizing=SIZING_MODE):
+    if sizing not in SIZING_MODES:
+        raise ValueError(f"sizing must be one of {SIZING_MODES}, got {sizing!r}")
 
-def backtest(df, strategy_fn):
     trades = []
 
+    # indicator state is causal, so compute it once and read bar i-1
+    # instead of recomputing on every slice
+    with span("bt.indicator"):
+        stop_atr = atr(df).to_numpy()
+        if sizing == "vol_target":
+            # the larger of Wilder ATR% and realized vol, re-read every bar
+            daily_vol = np.fmax(
+                (atr_wilder(df) / df["close"]).to_numpy(),
+                realized_vol(df["close"], VOL_LOOKBACK).to_numpy(),
+            )
+
+    # positional, so frames without a 0..n-1 RangeIndex get the right dates
+    dates = df["date"] if "date" in df.columns else df.index.to_series()
+
     for i in range(200, len(df) - 5):
         slice_df = df.iloc[:i]
 
-        if strategy_fn(slice_df):
+        with span("bt.strategy"):
+            signal = strategy_fn(slice_df)
+
+        if signal:
             entry = slice_df["close"].iloc[-1]
-            stop = entry - atr(slice_df).iloc[-1]
+            stop = entry - stop_atr[i - 1]
+
+            with span("bt.sizing"):
+                if sizing == "vol_target":
+                    qty = vol_target_size(entry, daily_vol[i - 1])
+                else:
+                    qty = position_size(entry, stop)
 
-            qty = position_size(entry, stop)
             exit_price = df["close"].iloc[i + 5]
 
             pnl = (exit_price - entry) * qty
 
             trades.append({
-                "date": slice_df.index[-1],
+                "date": dates.iloc[i - 1],
+                "exit_date": dates.iloc[i + 5],
                 "entry": entry,
                 "exit": exit_price,
                 "qty": qty,
@@ -25,3 +75,56 @@ def backtest(df, strategy_fn):
             })
 
     return trades
+
+# UNIVERSE COMPARISON (one process per symbol / sizing mode)
+def _run_one(job):
+    path, strategy_fn, sizing = job
+    trades = backtest(load_csv_cached(path), strategy_fn, sizing)
+    return symbol_from_path(path), sizing, trades
+
+def _summary(symbol, sizing, trades):
+    pnl = pd.Series([t["pnl"] for t in trades], dtype=float)
+    equity = CAPITAL + pnl.cumsum()
+    peak = np.maximum.accumulate(np.maximum(equity.to_numpy(), CAPITAL)) if len(pnl) else np.array([CAPITAL])
+    dd = ((equity.to_numpy() - peak) / peak * 100).min() if len(pnl) else 0.0
+
+    return {
+        "symbol": symbol,
+        "sizing": sizing,
+        "trades": len(trades),
+        "pnl": pnl.sum(),
+        "win_rate": (pnl > 0).mean() * 100 if len(pnl) else np.nan,
+        "pnl_std": pnl.std(),
+        "max_drawdown_pct": dd,
+    }
+
+def compare_sizing(paths, strategy_fn, modes=SIZING_MODES, workers=None):
+    """
+    Backtest every symbol under each sizing mode in parallel.
+    Returns (per symbol x mode summary, per mode totals).
+    """
+    # imported here: single-symbol backtests shouldn't pay for multiprocessing
+    from utils.startup import worker_pool
+
+    jobs = [(p, strategy_fn, m) for p in paths for m in modes]
+
+    with worker_pool(workers) as pool:
+        rows = [_summary(*r) for r in pool.map(_run_one, jobs)]
+
+    per_symbol = pd.DataFrame(rows)
+    totals = per_symbol.groupby("sizing").agg(
+        trades=("trades", "sum"),
+        pnl=("pnl", "sum"),
+        mean_pnl_std=("pnl_std", "mean"),
+        worst_drawdown_pct=("max_drawdown_pct", "min"),
+    )
+    return per_symbol, totals
+
+if __name__ == "__main__":
+    from core.strategies import trend_strategy
+    from utils.replay import resolve_paths
+
+    per_symbol, totals = compare_sizing(resolve_paths(), trend_strategy)
+    print("\n📊 SIZING COMPARISON")
+    print(per_symbol.to_string(index=False))
+    print(totals)
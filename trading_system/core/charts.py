@@ -0,0 +1,72 @@
+import threading
+from pathlib import Path
+
+from config import ATR_STOP_MULT, CHART_MAX_POINTS
+from core.indicators import ema, atr
+from core.strategies import trend_signals, sideways_signals
+from utils.downsample import build_levels
+from utils.loader import load_csv_cached
+
+LINE_COLS = ["ema20", "ema50", "ema200", "atr_stop"]
+
+
+def chart_frame(df):
+    """
+    Candles + overlays + signal flags for one symbol history.
+    """
+    close = df["close"]
+
+    out = df[["date", "open", "high", "low", "close"]].copy()
+    out["ema20"] = ema(close, 20)
+    out["ema50"] = ema(close, 50)
+    out["ema200"] = ema(close, 200)
+    out["atr_stop"] = close - atr(df) * ATR_STOP_MULT
+    out["trend"] = trend_signals(df).to_numpy()
+    out["sideways"] = sideways_signals(df).to_numpy()
+
+    return out.dropna(subset=["date", "open", "high", "low", "close"]).reset_index(drop=True)
+
+
+class ChartCache:
+    """
+    Precomputed zoom levels per file, rebuilt only when the file changes.
+
+    With a ResultStore the levels live on disk and are shared by every
+    dashboard worker; without one they are kept in this process only.
+    """
+
+    def __init__(self, store=None, max_points=CHART_MAX_POINTS):
+        self.store = store
+        self.max_points = max_points
+        self._charts = {}
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        path = Path(path)
+        st = path.stat()
+        sig = (st.st_mtime_ns, st.st_size)
+
+        if self.store is not None:
+            hit = self.store.get_object(f"chart__{path.stem}")
+            if hit is not None and hit[0] == sig:
+                return hit[1]
+        else:
+            with self._lock:
+                hit = self._charts.get(path)
+            if hit is not None and hit[0] == sig:
+                return hit[1]
+
+        frame = chart_frame(load_csv_cached(path))
+        chart = {
+            "levels": build_levels(frame, LINE_COLS, self.max_points),
+            "signals": frame.loc[frame["trend"] | frame["sideways"], ["date", "close", "trend"]],
+            "start": frame["date"].iloc[0] if len(frame) else None,
+            "end": frame["date"].iloc[-1] if len(frame) else None,
+        }
+
+        if self.store is not None:
+            self.store.put_object(f"chart__{path.stem}", (sig, chart))
+        else:
+            with self._lock:
+                self._charts[path] = (sig, chart)
+        return chart
@@ -0,0 +1,142 @@
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from config import COV_WINDOW, COV_SHRINKAGE, COV_MIN_SCALE
+
+STORE_KEY = "covariance"
+
+class RollingCovariance:
+    """
+    Rolling covariance of daily returns over a fixed universe.
+
+    Keeps running sums of r and r·rᵀ over the last `window` bars, so a new
+    bar costs O(k²) (add the new outer product, drop the oldest) instead of
+    a recompute over the whole history. Missing returns count as 0.
+    """
+
+    def __init__(self, symbols, window=COV_WINDOW, shrinkage=COV_SHRINKAGE):
+        self.symbols = list(symbols)
+        self.col = {s: i for i, s in enumerate(self.symbols)}
+        self.window = window
+        self.shrinkage = shrinkage
+
+        k = len(self.symbols)
+        self.bars = deque()
+        self.sum = np.zeros(k)
+        self.cross = np.zeros((k, k))
+        self.last_date = None
+        self._since_rebuild = 0
+
+    def update(self, returns, date=None):
+        r = np.nan_to_num(np.asarray(returns, dtype=float))
+
+        self.bars.append(r)
+        self.sum += r
+        self.cross += np.outer(r, r)
+
+        if len(self.bars) > self.window:
+            old = self.bars.popleft()
+            self.sum -= old
+            self.cross -= np.outer(old, old)
+
+        # running sums drift with float error, re-add them once per window
+        self._since_rebuild += 1
+        if self._since_rebuild >= self.window:
+            self._rebuild()
+
+        self.last_date = date
+
+    def _rebuild(self):
+        x = np.array(self.bars)
+        self.sum = x.sum(axis=0)
+        self.cross = x.T @ x
+        self._since_rebuild = 0
+
+    def update_frame(self, returns):
+        """
+        Feed a date x symbol returns frame, skipping dates already seen.
+        """
+        returns = returns.reindex(columns=self.symbols)
+        if self.last_date is not None:
+            returns = returns[returns.index > self.last_date]
+        for date, row in zip(returns.index, returns.to_numpy()):
+            self.update(row, date)
+
+    def covariance(self):
+        """
+        Sample covariance shrunk towards its diagonal.
+        """
+        n = len(self.bars)
+        if n < 2:
+            return np.full((len(self.symbols),) * 2, np.nan)
+
+        mean = self.sum / n
+        cov = (self.cross - n * np.outer(mean, mean)) / (n - 1)
+        return (1 - self.shrinkage) * cov + self.shrinkage * np.diag(np.diag(cov))
+
+    def correlation(self, symbols=None):
+        cov = self.covariance()
+        if symbols is not None:
+            idx = [self.col[s] for s in symbols]
+            cov = cov[np.ix_(idx, idx)]
+        vol = np.sqrt(np.diag(cov))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return cov / np.outer(vol, vol)
+
+def returns_panel(histories):
+    """
+    {symbol: history frame} -> date x symbol daily close-to-close returns.
+    """
+    closes = {
+        s: df.drop_duplicates("date", keep="last").set_index("date")["close"]
+        for s, df in histories.items() if "date" in df.columns
+    }
+    return pd.DataFrame(closes).sort_index().pct_change(fill_method=None).iloc[1:]
+
+def load_or_build(histories, store=None, window=COV_WINDOW, shrinkage=COV_SHRINKAGE):
+    """
+    Cached state from the store, brought up to date with only the new bars.
+    """
+    panel = returns_panel(histories)
+
+    cov = store.get_object(STORE_KEY) if store is not None else None
+    if cov is None or cov.symbols != list(panel.columns) or cov.window != window:
+        cov = RollingCovariance(panel.columns, window=window, shrinkage=shrinkage)
+
+    before = cov.last_date
+    cov.update_frame(panel)
+    if store is not None and cov.last_date != before:
+        store.put_object(STORE_KEY, cov)
+    return cov
+
+def correlation_scale(cov, symbols, min_scale=COV_MIN_SCALE):
+    """
+    Risk multiplier per candidate from its marginal contribution to the
+    volatility of today's candidate set (equal vol-normalised risk units).
+
+    Uncorrelated candidates keep 1.0; n perfectly correlated ones get
+    1/sqrt(n) each, i.e. together they carry the volatility of n
+    independent trades. Symbols without history keep 1.0.
+    """
+    symbols = list(symbols)
+    scale = np.ones(len(symbols))
+
+    known = [i for i, s in enumerate(symbols) if s in cov.col]
+    if len(known) < 2:
+        return scale
+
+    corr = cov.correlation([symbols[i] for i in known])
+    corr = np.nan_to_num(corr, nan=0.0)
+    np.fill_diagonal(corr, 1.0)
+
+    contrib = corr.sum(axis=1)                 # (C·1)_i
+    port_vol = np.sqrt(max(contrib.sum(), 1e-12))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = port_vol / (np.sqrt(len(known)) * contrib)
+
+    # hedging (negative) contributions never add risk above one unit
+    s = np.where(contrib > 0, s, 1.0)
+    scale[known] = np.clip(s, min_scale, 1.0)
+    return scale
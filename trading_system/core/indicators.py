@@ -22,3 +22,20 @@ def atr(df, period=14):
 
     tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
     return tr.rolling(period).mean()
+
+def atr_wilder(df, period=14):
+    """
+    Wilder-smoothed ATR (alpha = 1/period), as in volatility calc.py.
+    """
+    high_low = df["high"] - df["low"]
+    high_close = (df["high"] - df["close"].shift()).abs()
+    low_close = (df["low"] - df["close"].shift()).abs()
+
+    tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+    return tr.ewm(alpha=1/period, adjust=False, min_periods=period).mean()
+
+def realized_vol(series, period=20):
+    """
+    Rolling std of daily close-to-close returns (not annualised).
+    """
+    return series.pct_change(fill_method=None).rolling(period).std()
@@ -1,4 +1,7 @@
-from config import RISK_RS
+import numpy as np
+import pandas as pd
+
+from config import CAPITAL, RISK_PER_TRADE, RISK_RS, MAX_TRADE_EXPOSURE_PCT
 
 def position_size(entry_price, stop_price):
     risk_per_share = abs(entry_price - stop_price)
@@ -8,3 +11,61 @@ def position_size(entry_price, stop_price):
 
     qty = int(RISK_RS / risk_per_share)
     return max(qty, 0)
+
+# DRAWDOWN RISK REDUCTION (same rule as position cal.py)
+def drawdown_factor(drawdown_pct):
+    dd = np.asarray(drawdown_pct, dtype=float)
+    return np.where(dd > 5, np.maximum(0.5, 1 - dd / 20), 1.0)
+
+def size_batch(entry, stop, target=None, atr=None,
+               capital=CAPITAL, risk_pct=RISK_PER_TRADE * 100,
+               max_trade_exp_pct=MAX_TRADE_EXPOSURE_PCT, drawdown_pct=0.0):
+    """
+    Size every candidate in one call (long trades, stop below entry).
+
+    Scalars broadcast, so capital / risk / drawdown can be shared or per row.
+    Rows with an invalid stop get qty 0 and valid=False instead of raising.
+    """
+    index = entry.index if isinstance(entry, pd.Series) else None
+
+    entry = np.asarray(entry, dtype=float)
+    stop = np.asarray(stop, dtype=float)
+    capital = np.broadcast_to(np.asarray(capital, dtype=float), entry.shape)
+
+    risk_per_share = entry - stop
+    valid = risk_per_share > 0
+    rps = np.where(valid, risk_per_share, np.nan)
+
+    factor = drawdown_factor(drawdown_pct)
+    adj_risk_pct = np.broadcast_to(risk_pct * factor, entry.shape)
+    risk_limit = capital * adj_risk_pct / 100
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        risk_qty = np.floor(risk_limit / rps)
+        exp_qty = np.floor(capital * max_trade_exp_pct / 100 / entry)
+
+    qty = np.fmin(risk_qty, exp_qty)
+    qty = np.where(valid & (qty > 0), qty, 0).astype(np.int64)
+
+    out = {
+        "qty": qty,
+        "risk_per_share": rps,
+        "risk_rs": qty * risk_per_share,
+        "risk_pct": qty * risk_per_share / capital * 100,
+        "adj_risk_pct": adj_risk_pct,
+        "risk_limit_rs": risk_limit,
+        "investment": qty * entry,
+        "exposure_pct": qty * entry / capital * 100,
+        "exposure_clamped": valid & (exp_qty < risk_qty),
+        "valid": valid,
+    }
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if target is not None:
+            target = np.asarray(target, dtype=float)
+            out["rr"] = (target - entry) / rps
+            out["reward_rs"] = (target - entry) * qty
+        if atr is not None:
+            out["atr_ratio"] = rps / np.asarray(atr, dtype=float)
+
+    return pd.DataFrame(out, index=index)
@@ -0,0 +1,348 @@
+import ast
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# =========================================================
+# SHARED SCREEN ENGINE
+# =========================================================
+# Snapshot cleaning, the screen expression language and symbol-from-file
+# parsing. Used by the watcher / loader here and by the repo-root
+# screnner.py and "volatility calc.py", so thresholds and syntax live here only.
+
+QUOTE_SYMBOL_RE = re.compile(r"Quote-Equity-(.+?)-(?:EQ)?-\d")
+
+
+def symbol_from_path(path):
+    """
+    'Quote-Equity-HAL-EQ-14-02-2025-...csv' -> 'HAL', otherwise the file stem.
+    """
+    name = os.path.basename(path)
+    m = QUOTE_SYMBOL_RE.search(name)
+    return m.group(1) if m else os.path.splitext(name)[0]
+
+
+@lru_cache(maxsize=1)
+def _numexpr():
+    """
+    numexpr if installed, imported on the first compiled screen only.
+    """
+    try:
+        import numexpr
+    except ImportError:
+        return None
+    return numexpr
+
+
+SNAPSHOT_COLUMNS = {
+    "SYMBOL \n": "symbol",
+    "LTP \n": "price",
+    "VALUE \n (₹ Crores)": "value_cr",
+    "%CHNG \n": "day_change",
+    "52W H \n": "high52",
+    "52W L \n": "low52"
+}
+
+NUMERIC_COLUMNS = ["price", "value_cr", "day_change", "high52", "low52"]
+NULL_TOKENS = ["", "-", "NA", "nan", "None"]
+
+# same thresholds as before, now editable without touching code
+DEFAULT_SCREEN = (
+    "value_cr >= 300"                   # 🟦 1) Liquidity filter
+    " and price >= 50"                  # 🟦 2) Price filter (avoid penny / junk)
+    " and day_change >= 1.0"            # 🟦 3) Momentum filter (avoid weak green days)
+    " and 5 <= pullback <= 35"          # 🟦 4) Pullback from 52W High
+    " and range_pos >= 40"              # 🟦 5) Range position (NaN when 52W range <= 0)
+)
+
+
+def clean_num(x):
+    s = str(x).replace(",", "").strip()
+    if s in NULL_TOKENS:
+        return None
+    try:
+        return float(s)
+    except:
+        return None
+
+
+def clean_num_col(col):
+    """
+    Vectorized clean_num() for a whole column.
+    """
+    if pd.api.types.is_numeric_dtype(col):
+        return col.astype(float)
+
+    s = col.astype(str).str.replace(",", "", regex=False).str.strip()
+    s = s.mask(s.isin(NULL_TOKENS))
+    return pd.to_numeric(s, errors="coerce")
+
+
+def prepare_snapshot(df):
+    """
+    Rename + clean a MW-* snapshot and add pullback / range_pos columns.
+    """
+    df = df.rename(columns=SNAPSHOT_COLUMNS)
+
+    for col in NUMERIC_COLUMNS:
+        if col in df.columns:
+            df[col] = clean_num_col(df[col])
+
+    df = df.dropna(subset=["symbol", "price", "value_cr", "day_change", "high52", "low52"]).copy()
+    df["symbol"] = df["symbol"].astype(str).str.strip()
+
+    df["pullback"], df["range_pos"] = range_fields(
+        df["price"].to_numpy(), df["high52"].to_numpy(), df["low52"].to_numpy()
+    )
+
+    return df
+
+
+def range_fields(price, high52, low52):
+    """
+    pullback % from 52W high and position % inside the 52W range.
+    """
+    span = high52 - low52
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pullback = (high52 - price) / high52 * 100
+        range_pos = np.where(span > 0, (price - low52) / span * 100, np.nan)
+
+    return pullback, range_pos
+
+
+# =========================================================
+# SCREEN EXPRESSIONS
+# =========================================================
+# e.g.  "value_cr >= 300 and 5 <= pullback <= 35"
+# Parsed once, compiled to NumPy ufunc calls (or numexpr when installed)
+# and evaluated on whole columns.
+
+_BIN_OPS = {
+    ast.Add: (np.add, "+"),
+    ast.Sub: (np.subtract, "-"),
+    ast.Mult: (np.multiply, "*"),
+    ast.Div: (np.divide, "/"),
+    ast.Pow: (np.power, "**"),
+}
+
+_CMP_OPS = {
+    ast.Lt: (np.less, "<"),
+    ast.LtE: (np.less_equal, "<="),
+    ast.Gt: (np.greater, ">"),
+    ast.GtE: (np.greater_equal, ">="),
+    ast.Eq: (np.equal, "=="),
+    ast.NotEq: (np.not_equal, "!="),
+}
+
+_FUNCS = {
+    "abs": (np.abs, "abs"),
+    "where": (np.where, "where"),
+    "log": (np.log, "log"),
+    "sqrt": (np.sqrt, "sqrt"),
+    "min": (np.minimum, None),      # no numexpr equivalent
+    "max": (np.maximum, None),
+}
+
+# numexpr only pays off once arrays are big enough to amortise its setup
+NUMEXPR_MIN_ROWS = 100_000
+
+
+class ScreenExpr:
+    """
+    A compiled screen / derived-field expression.
+    """
+
+    def __init__(self, source):
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid screen expression {source!r}: {e.msg}") from None
+
+        self.source = source
+        self.fields = set()
+        self._fn = self._compile(tree.body)
+        self._ne = self._to_numexpr(tree.body) if _numexpr() is not None else None
+
+    def __call__(self, fields):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if self._ne is not None and fields.size >= NUMEXPR_MIN_ROWS:
+                local = {name: fields[name] for name in self.fields}
+                return _numexpr().evaluate(self._ne, local_dict=local)
+            return self._fn(fields)
+
+    def _compile(self, node):
+        if isinstance(node, ast.BoolOp):
+            parts = [self._compile(v) for v in node.values]
+            op = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+
+            def bool_op(f):
+                out = parts[0](f)
+                for p in parts[1:]:
+                    out = op(out, p(f))
+                return out
+            return bool_op
+
+        if isinstance(node, ast.Compare):
+            # chained: 5 <= pullback <= 35  ->  (5 <= pullback) & (pullback <= 35)
+            terms = [self._compile(node.left)] + [self._compile(c) for c in node.comparators]
+            ops = [self._lookup(_CMP_OPS, op)[0] for op in node.ops]
+
+            def compare(f):
+                vals = [t(f) for t in terms]
+                out = ops[0](vals[0], vals[1])
+                for i in range(1, len(ops)):
+                    out = np.logical_and(out, ops[i](vals[i], vals[i + 1]))
+                return out
+            return compare
+
+        if isinstance(node, ast.BinOp):
+            fn = self._lookup(_BIN_OPS, node.op)[0]
+            left, right = self._compile(node.left), self._compile(node.right)
+            return lambda f: fn(left(f), right(f))
+
+        if isinstance(node, ast.UnaryOp):
+            operand = self._compile(node.operand)
+            if isinstance(node.op, ast.Not):
+                return lambda f: np.logical_not(operand(f))
+            if isinstance(node.op, ast.USub):
+                return lambda f: np.negative(operand(f))
+            if isinstance(node.op, ast.UAdd):
+                return operand
+
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+            if node.func.id not in _FUNCS:
+                raise ValueError(f"Unknown function '{node.func.id}' in {self.source!r}")
+            fn = _FUNCS[node.func.id][0]
+            args = [self._compile(a) for a in node.args]
+            return lambda f: fn(*(a(f) for a in args))
+
+        if isinstance(node, ast.Name):
+            name = node.id
+            self.fields.add(name)
+            return lambda f: f[name]
+
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+                and not isinstance(node.value, bool):
+            value = node.value
+            return lambda f: value
+
+        raise ValueError(f"Unsupported syntax '{ast.unparse(node)}' in {self.source!r}")
+
+    def _lookup(self, table, op):
+        if type(op) not in table:
+            raise ValueError(f"Unsupported operator in {self.source!r}")
+        return table[type(op)]
+
+    def _to_numexpr(self, node):
+        """
+        Same tree as a numexpr string, or None if something is not supported.
+        """
+        if isinstance(node, ast.BoolOp):
+            parts = [self._to_numexpr(v) for v in node.values]
+            if None in parts:
+                return None
+            joiner = " & " if isinstance(node.op, ast.And) else " | "
+            return "(" + joiner.join(parts) + ")"
+
+        if isinstance(node, ast.Compare):
+            terms = [self._to_numexpr(node.left)] + [self._to_numexpr(c) for c in node.comparators]
+            if None in terms:
+                return None
+            parts = [
+                f"({terms[i]} {_CMP_OPS[type(op)][1]} {terms[i + 1]})"
+                for i, op in enumerate(node.ops)
+            ]
+            return "(" + " & ".join(parts) + ")"
+
+        if isinstance(node, ast.BinOp):
+            left, right = self._to_numexpr(node.left), self._to_numexpr(node.right)
+            if left is None or right is None:
+                return None
+            return f"({left} {_BIN_OPS[type(node.op)][1]} {right})"
+
+        if isinstance(node, ast.UnaryOp):
+            operand = self._to_numexpr(node.operand)
+            if operand is None:
+                return None
+            if isinstance(node.op, ast.Not):
+                return f"(~{operand})"
+            if isinstance(node.op, ast.USub):
+                return f"(-{operand})"
+            return operand
+
+        if isinstance(node, ast.Call):
+            ne_name = _FUNCS[node.func.id][1]
+            args = [self._to_numexpr(a) for a in node.args]
+            if ne_name is None or None in args:
+                return None
+            return f"{ne_name}({', '.join(args)})"
+
+        if isinstance(node, ast.Name):
+            return node.id
+
+        return repr(float(node.value))
+
+
+@lru_cache(maxsize=256)
+def compile_expr(source):
+    return ScreenExpr(source)
+
+
+class _Fields(dict):
+    """
+    Column lookup that evaluates derived fields on first use and keeps them.
+    """
+
+    def __init__(self, df, derived):
+        super().__init__()
+        self._df = df
+        self.size = len(df)
+        self._derived = derived
+        self._resolving = set()
+
+    def __missing__(self, name):
+        if name in self._derived:
+            if name in self._resolving:
+                raise ValueError(f"Derived field '{name}' refers to itself")
+            self._resolving.add(name)
+            value = compile_expr(self._derived[name])(self)
+            self._resolving.discard(name)
+        elif name in self._df.columns:
+            value = self._df[name].to_numpy(dtype=float, na_value=np.nan)
+        else:
+            raise ValueError(f"Unknown field '{name}'")
+
+        self[name] = value
+        return value
+
+
+def evaluate_screens(df, screens, derived=None):
+    """
+    Evaluate several named screens against one prepared snapshot.
+
+    screens: {"name": "expr", ...}
+    derived: {"field": "expr", ...}, computed once and shared by all screens.
+
+    Returns a DataFrame of boolean masks (one column per screen), aligned to df.
+    """
+    fields = _Fields(df, derived or {})
+    masks = {}
+
+    for name, source in screens.items():
+        result = np.broadcast_to(compile_expr(source)(fields), (len(df),))
+        masks[name] = result.astype(bool)
+
+    return pd.DataFrame(masks, index=df.index)
+
+
+def run_screens_on_df(df, screens, derived=None):
+    """
+    Clean a raw snapshot once and attach one boolean column per screen.
+    """
+    df = prepare_snapshot(df)
+    masks = evaluate_screens(df, screens, derived)
+    return pd.concat([df, masks], axis=1)
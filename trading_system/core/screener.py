@@ -0,0 +1,46 @@
+import pandas as pd
+
+from config import SCREENS
+from core.screen_engine import DEFAULT_SCREEN, evaluate_screens, range_fields
+from utils.loader import _to_numeric
+
+# loader-normalised MW-* snapshot column -> screen field
+SNAPSHOT_FIELDS = {
+    "symbol": "symbol",
+    "close": "price",
+    "value \n (₹ crores)": "value_cr",
+    "%chng": "day_change",
+    "52w h": "high52",
+    "52w l": "low52",
+}
+
+
+def snapshot_fields(df):
+    """
+    Screen fields (price, value_cr, day_change, pullback, range_pos, ...)
+    from a snapshot loaded with utils.loader.load_csv.
+    """
+    out = df[[c for c in SNAPSHOT_FIELDS if c in df.columns]].rename(columns=SNAPSHOT_FIELDS)
+
+    for col in ["price", "value_cr", "day_change", "high52", "low52"]:
+        if col in out.columns:
+            out[col] = _to_numeric(out[col])
+
+    out["symbol"] = out["symbol"].astype(str).str.strip()
+
+    if "high52" in out.columns and "low52" in out.columns:
+        out["pullback"], out["range_pos"] = range_fields(
+            out["price"].to_numpy(), out["high52"].to_numpy(), out["low52"].to_numpy()
+        )
+
+    return out
+
+
+def run_screens(df, screens=None):
+    """
+    DEFAULT_SCREEN (as "swing") plus config.SCREENS in one pass over a snapshot.
+    Returns the screen fields plus one bool column per screen.
+    """
+    screens = screens or {"swing": DEFAULT_SCREEN, **SCREENS}
+    fields = snapshot_fields(df)
+    return pd.concat([fields, evaluate_screens(fields, screens)], axis=1)
@@ -1,19 +1,28 @@
 from core.indicators import ema, rsi, atr
 
 # TREND STRATEGY (YOUR MAIN SYSTEM)
-def trend_strategy(df):
+def trend_signals(df):
+    """
+    trend_strategy() evaluated on every bar at once (bool Series).
+    """
     close = df["close"]
     volume = df["volume"]
+    r = rsi(close)
+
+    return (
+        (close > close.rolling(20).max().shift(1))
+        & (volume > volume.rolling(20).mean())
+        & (ema(close, 20) > ema(close, 50))
+        & (r > 50) & (r < 75)
+    )
 
-    conds = [
-        close.iloc[-1] > close.rolling(20).max().shift(1).iloc[-1],
-        volume.iloc[-1] > volume.rolling(20).mean().iloc[-1],
-        ema(close, 20).iloc[-1] > ema(close, 50).iloc[-1],
-        50 < rsi(close).iloc[-1] < 75
-    ]
-    return all(conds)
+def trend_strategy(df):
+    return bool(trend_signals(df).iloc[-1])
 
 # SIDEWAYS STRATEGY (RANGE BREAK + MEAN REVERT)
-def sideways_strategy(df):
+def sideways_signals(df):
     r = rsi(df["close"])
-    return r.iloc[-1] < 30 or r.iloc[-1] > 70
+    return (r < 30) | (r > 70)
+
+def sideways_strategy(df):
+    return bool(sideways_signals(df).iloc[-1])
@@ -1,44 +1,268 @@
 import dash
-from dash import html, dcc, dash_table
 import pandas as pd
+import plotly.graph_objects as go
+from dash import html, dcc, dash_table, Input, Output, State
 
-from core.engine import run_system
+from config import DASH_POLL_MS, DASH_PAGE_SIZE, CHART_MAX_POINTS
+from core.analytics import run_ids, load_run
+from core.charts import ChartCache
+from utils.downsample import pick_level
+from utils.loader import symbol_from_path
+from utils.paging import PageCache
+from utils.refresher import BackgroundRefresher
+from utils.store import ResultStore
 
 app = dash.Dash(__name__)
 
-output = run_system(
-    nifty_path="data/indices/MW-NIFTY-50-01-Feb-2026.csv",
-    sector_paths={
-        "IT": "data/sectors/MW-NIFTY-IT-01-Feb-2026.csv"
-    },
-    stock_paths={
-        "IT": {
-            "TCS": "data/stocks/Quote-Equity-TCS--01-02-2025-01-02-2026.csv"
-        }
-    }
-)
+# results are computed by the background refresher, never on page load
+store = ResultStore()
+charts = ChartCache(store)
+refresher = BackgroundRefresher(store, charts=charts)
+pages = PageCache()
 
-# normalize output
-if isinstance(output, dict):
-    df = pd.DataFrame([output])
-elif isinstance(output, list):
-    df = pd.DataFrame(output)
-else:
-    df = pd.DataFrame()
+# WSGI entry point (see dashboard/wsgi.py)
+server = app.server
 
 app.layout = html.Div(
     style={"padding": "20px"},
     children=[
         html.H2("📊 Swing Trading Dashboard"),
 
+        dcc.Dropdown(id="table", value="system", clearable=False, style={"width": "300px"}),
+        html.Div(id="status", style={"color": "gray"}),
+
+        # paging / sorting / filtering happen server-side, only the
+        # visible page is serialised to the browser
         dash_table.DataTable(
-            data=df.to_dict("records"),
-            columns=[{"name": c, "id": c} for c in df.columns],
+            id="results",
+            data=[],
+            columns=[],
+            page_current=0,
+            page_size=DASH_PAGE_SIZE,
+            page_action="custom",
+            sort_action="custom",
+            sort_mode="multi",
+            sort_by=[],
+            filter_action="custom",
+            filter_query="",
             style_table={"overflowX": "auto"},
             style_cell={"textAlign": "center"},
         ),
+
+        html.H3("📈 Chart"),
+        dcc.Dropdown(id="symbol", clearable=False, style={"width": "300px"}),
+        dcc.Graph(id="chart", style={"height": "600px"}),
+
+        html.H3("🧪 Backtests"),
+        dcc.Dropdown(id="run", clearable=False, style={"width": "300px"}),
+        html.Div(
+            style={"display": "flex", "gap": "20px"},
+            children=[
+                dash_table.DataTable(id="by_entry_reason", style_cell={"textAlign": "center"}),
+                dash_table.DataTable(id="by_exit_reason", style_cell={"textAlign": "center"}),
+            ],
+        ),
+        dcc.Graph(id="equity"),
+        dcc.Graph(id="monthly"),
+
+        dcc.Interval(id="tick", interval=DASH_POLL_MS),
+        dcc.Store(id="version"),
     ],
 )
 
+
+@app.callback(
+    Output("table", "options"),
+    Input("tick", "n_intervals"),
+)
+def refresh_tables(_):
+    return [{"label": n, "value": n} for n in store.names()]
+
+
+@app.callback(
+    Output("results", "data"),
+    Output("results", "columns"),
+    Output("results", "page_count"),
+    Output("status", "children"),
+    Output("version", "data"),
+    Input("tick", "n_intervals"),
+    Input("table", "value"),
+    Input("results", "page_current"),
+    Input("results", "page_size"),
+    Input("results", "sort_by"),
+    Input("results", "filter_query"),
+    State("version", "data"),
+)
+def refresh_table(_, name, page_current, page_size, sort_by, filter_query, seen_version):
+    version = store.version(name)
+    if version is None:
+        return [], [], 1, "⏳ Waiting for first run...", None
+
+    # timer tick and the table did not change: send nothing
+    if dash.ctx.triggered_id == "tick" and seen_version == [name, *version]:
+        return (dash.no_update,) * 5
+
+    df = store.get(name)
+    try:
+        records, page_count, total = pages.page(
+            name, version, df, page_current, page_size, filter_query, sort_by
+        )
+    except ValueError as e:
+        return [], dash.no_update, 1, f"❌ {e}", dash.no_update
+
+    return (
+        records,
+        [{"name": c, "id": c} for c in df.columns],
+        page_count,
+        f"{name}: {total:,} of {len(df):,} rows",
+        [name, *version],
+    )
+
+
+# =========================================================
+# CHART
+# =========================================================
+def symbol_paths():
+    return {
+        symbol_from_path(p): p
+        for p in refresher.watcher.files()
+        if p.name.startswith("Quote-Equity-")
+    }
+
+
+@app.callback(
+    Output("symbol", "options"),
+    Output("symbol", "value"),
+    Input("tick", "n_intervals"),
+    State("symbol", "value"),
+)
+def refresh_symbols(_, current):
+    symbols = sorted(symbol_paths())
+    if current in symbols:
+        return [{"label": s, "value": s} for s in symbols], dash.no_update
+    return [{"label": s, "value": s} for s in symbols], symbols[0] if symbols else None
+
+
+def _visible_range(relayout):
+    relayout = relayout or {}
+    if "xaxis.range[0]" in relayout:
+        return relayout["xaxis.range[0]"], relayout["xaxis.range[1]"]
+    if "xaxis.range" in relayout:
+        return tuple(relayout["xaxis.range"])
+    return None, None
+
+
+@app.callback(
+    Output("chart", "figure"),
+    Input("symbol", "value"),
+    Input("chart", "relayoutData"),
+)
+def render_chart(symbol, relayout):
+    paths = symbol_paths()
+    if symbol not in paths:
+        return go.Figure()
+
+    chart = charts.get(paths[symbol])
+    if chart["start"] is None:
+        # header-only file or every row dropped: nothing to draw yet
+        return go.Figure(layout={"title": f"{symbol} (no data)"})
+
+    start, end = _visible_range(relayout) if dash.ctx.triggered_id == "chart" else (None, None)
+    level = pick_level(chart["levels"], start, end, CHART_MAX_POINTS)
+
+    # ship the visible window plus one window either side for panning
+    lo, hi = chart["start"], chart["end"]
+    if start is not None:
+        width = pd.Timestamp(end) - pd.Timestamp(start)
+        lo, hi = pd.Timestamp(start) - width, pd.Timestamp(end) + width
+
+    c = level["candles"]
+    c = c[(c["date"] >= lo) & (c["date"] <= hi)]
+
+    fig = go.Figure()
+    fig.add_trace(go.Candlestick(
+        x=c["date"], open=c["open"], high=c["high"], low=c["low"], close=c["close"], name=symbol,
+    ))
+
+    for name, (x, y) in level["lines"].items():
+        keep = (x >= lo) & (x <= hi)
+        fig.add_trace(go.Scattergl(x=x[keep], y=y[keep], mode="lines", name=name.upper()))
+
+    sig = chart["signals"]
+    sig = sig[(sig["date"] >= lo) & (sig["date"] <= hi)]
+    for flag, label, color, marker in [(True, "TREND", "green", "triangle-up"),
+                                       (False, "SIDEWAYS", "orange", "circle")]:
+        s = sig[sig["trend"] == flag]
+        fig.add_trace(go.Scattergl(
+            x=s["date"], y=s["close"], mode="markers", name=label,
+            marker={"color": color, "symbol": marker, "size": 9},
+        ))
+
+    fig.update_layout(
+        uirevision=symbol,
+        xaxis_rangeslider_visible=False,
+        margin={"l": 40, "r": 10, "t": 30, "b": 30},
+        title=f"{symbol} (1 candle = {level['bucket']} bars)",
+    )
+    return fig
+
+
+# =========================================================
+# BACKTESTS (aggregates are precomputed per run id)
+# =========================================================
+@app.callback(
+    Output("run", "options"),
+    Output("run", "value"),
+    Input("tick", "n_intervals"),
+    State("run", "value"),
+)
+def refresh_runs(_, current):
+    runs = run_ids(store)
+    if current in runs:
+        return runs, dash.no_update
+    return runs, runs[0] if runs else None
+
+
+def _records(df):
+    df = df.round(2)
+    return df.to_dict("records"), [{"name": c, "id": c} for c in df.columns]
+
+
+@app.callback(
+    Output("by_entry_reason", "data"),
+    Output("by_entry_reason", "columns"),
+    Output("by_exit_reason", "data"),
+    Output("by_exit_reason", "columns"),
+    Output("equity", "figure"),
+    Output("monthly", "figure"),
+    Input("run", "value"),
+)
+def render_run(run_id):
+    if run_id is None:
+        return [], [], [], [], go.Figure(), go.Figure()
+
+    agg = load_run(store, run_id)
+    if any(v is None for v in agg.values()):
+        return [], [], [], [], go.Figure(), go.Figure()
+
+    curve = agg["equity"]
+    equity = go.Figure()
+    equity.add_trace(go.Scattergl(x=curve["date"], y=curve["equity"], name="Equity"))
+    equity.add_trace(go.Scattergl(x=curve["date"], y=curve["drawdown_pct"], name="Drawdown %",
+                                  yaxis="y2", fill="tozeroy", line={"color": "red"}))
+    equity.update_layout(title="Equity & Drawdown",
+                         yaxis2={"overlaying": "y", "side": "right", "title": "DD %"})
+
+    m = agg["monthly"]
+    monthly = go.Figure(go.Bar(
+        x=m["month"], y=m["return_pct"],
+        marker_color=["green" if v >= 0 else "red" for v in m["return_pct"]],
+    ))
+    monthly.update_layout(title="Monthly Return %")
+
+    return (*_records(agg["by_entry_reason"]), *_records(agg["by_exit_reason"]), equity, monthly)
+
+
 if __name__ == "__main__":
-    app.run(debug=True)
+    refresher.start()
+    app.run(debug=True, use_reloader=False)
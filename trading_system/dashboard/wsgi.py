@@ -0,0 +1,12 @@
+"""
+Production serving, from trading_system/:
+
+    gunicorn -w 4 -b 0.0.0.0:8050 dashboard.wsgi:server
+
+Every worker starts a refresher, but only the one holding the store lock
+computes; all workers read results and chart levels from the shared
+on-disk ResultStore. Do not use --preload (threads do not survive fork).
+"""
+from dashboard.app import server, refresher
+
+refresher.start()
@@ -1,20 +1,23 @@
+from config import SYSTEM_INPUTS
 from core.engine import run_system
+from utils import profiler
+from utils.loader import PROJECT_ROOT
 
 def main():
-    results = run_system(
-        nifty_path="data/indices/MW-NIFTY-50-01-Feb-2026.csv",
-        sector_paths={
-            "IT": "data/sectors/MW-NIFTY-IT-01-Feb-2026.csv"
-        },
-        stock_paths={
-            "IT": {
-                "TCS": "data/stocks/Quote-Equity-TCS--01-02-2025-01-02-2026.csv"
-            }
-        }
-    )
+    with profiler.span("run_system"):
+        results = run_system(**SYSTEM_INPUTS)
 
-    print("\n📊 SYSTEM OUTPUT")
-    print(results)
+    with profiler.span("output"):
+        print("\n📊 SYSTEM OUTPUT")
+        print(results)
+
+    if profiler.ENABLED:
+        profiler.print_summary(
+            profiler.write_report(
+                PROJECT_ROOT / "profile_report.json",
+                chrome_trace=PROJECT_ROOT / "profile_trace.json",
+            )
+        )
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+
+
+def lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets: indices of n_out points that keep the
+    visual shape of the (x, y) line. x must be increasing, y NaN-free.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    a = 0
+
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            nxt = slice(edges[i + 1], edges[i + 2])
+        else:
+            nxt = slice(n - 1, n)
+
+        avg_x = x[nxt].mean()
+        avg_y = y[nxt].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        idx[i + 1] = a
+
+    return idx
+
+
+def ohlc_buckets(df, bucket):
+    """
+    Merge every `bucket` bars into one candle (first open, max high,
+    min low, last close), so highs/lows survive any zoom level.
+    """
+    if bucket <= 1:
+        return df[["date", "open", "high", "low", "close"]].reset_index(drop=True)
+
+    g = np.arange(len(df)) // bucket
+    return (
+        df.groupby(g)
+        .agg(date=("date", "first"), open=("open", "first"), high=("high", "max"),
+             low=("low", "min"), close=("close", "last"))
+        .reset_index(drop=True)
+    )
+
+
+def line_points(dates, values, n_out):
+    """
+    LTTB-downsampled (dates, values) for one chart line, NaNs dropped.
+    """
+    values = np.asarray(values, dtype=float)
+    ok = ~np.isnan(values)
+    d = np.asarray(dates)[ok]
+    v = values[ok]
+
+    idx = lttb(d.astype("datetime64[ns]").astype(np.int64), v, n_out)
+    return d[idx], v[idx]
+
+
+def build_levels(frame, line_cols, max_points=1000, factor=4):
+    """
+    Zoom pyramid: level k merges factor**k bars. Each level keeps candles
+    plus LTTB lines at the same point budget.
+    """
+    levels = []
+    bucket = 1
+
+    while True:
+        candles = ohlc_buckets(frame, bucket)
+        lines = {
+            col: line_points(frame["date"], frame[col], max(len(candles), 3))
+            for col in line_cols
+        }
+        levels.append({"bucket": bucket, "candles": candles, "lines": lines})
+
+        if len(candles) <= max_points:
+            break
+        bucket *= factor
+
+    return levels
+
+
+def pick_level(levels, start=None, end=None, max_points=1000):
+    """
+    Finest level that shows at most max_points candles in [start, end].
+    """
+    for level in levels:
+        dates = level["candles"]["date"]
+        lo = 0 if start is None else dates.searchsorted(pd.Timestamp(start))
+        hi = len(dates) if end is None else dates.searchsorted(pd.Timestamp(end), side="right")
+        if hi - lo <= max_points:
+            return level
+    return levels[-1]
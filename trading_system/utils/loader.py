@@ -1,8 +1,17 @@
+import threading
+
 import pandas as pd
 from pathlib import Path
 
+from core.screen_engine import symbol_from_path
+from utils.profiler import span
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
+# resolved path -> ((mtime_ns, size), DataFrame)
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
 
 def _to_numeric(series: pd.Series) -> pd.Series:
     """
@@ -45,8 +54,14 @@ def load_csv(relative_path: str) -> pd.DataFrame:
     if not full_path.exists():
         raise FileNotFoundError(f"CSV not found: {full_path}")
 
-    df = pd.read_csv(full_path)
+    with span("load.read", file=full_path.name):
+        df = pd.read_csv(full_path)
+
+    with span("load.normalize", file=full_path.name):
+        return _normalize(df, relative_path)
+
 
+def _normalize(df: pd.DataFrame, relative_path: str) -> pd.DataFrame:
     # normalize column names
     df.columns = [c.strip().lower() for c in df.columns]
 
@@ -99,3 +114,36 @@ def load_csv(relative_path: str) -> pd.DataFrame:
         df = df.sort_values("date")
 
     return df.reset_index(drop=True)
+
+
+def load_csv_cached(relative_path: str) -> pd.DataFrame:
+    """
+    load_csv() memoised on (mtime, size): unchanged files are not re-parsed.
+    The returned frame is shared, treat it as read-only.
+    """
+    full_path = (PROJECT_ROOT / relative_path).resolve()
+
+    if not full_path.exists():
+        raise FileNotFoundError(f"CSV not found: {full_path}")
+
+    st = full_path.stat()
+    sig = (st.st_mtime_ns, st.st_size)
+
+    with _CACHE_LOCK:
+        hit = _CACHE.get(full_path)
+    if hit is not None and hit[0] == sig:
+        return hit[1]
+
+    df = load_csv(full_path)
+
+    with _CACHE_LOCK:
+        _CACHE[full_path] = (sig, df)
+    return df
+
+
+def invalidate_cache(relative_path=None):
+    with _CACHE_LOCK:
+        if relative_path is None:
+            _CACHE.clear()
+        else:
+            _CACHE.pop((PROJECT_ROOT / relative_path).resolve(), None)
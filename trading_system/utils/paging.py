@@ -0,0 +1,140 @@
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# DataTable filter_query, e.g.  {value_cr} >= 300 && {symbol} scontains TC
+# the table prefixes text ops with i (ignore case) or s (case sensitive)
+_FILTER_PART_RE = re.compile(
+    r"^\{(?P<col>[^}]+)\}\s*"
+    r"(?P<case>[is])?(?P<op>>=|<=|!=|<|>|=|eq|ne|lt|le|gt|ge|contains|datestartswith)\s*"
+    r"(?P<val>.*)$"
+)
+
+_OPS = {
+    "=": "eq", "eq": "eq",
+    "!=": "ne", "ne": "ne",
+    "<": "lt", "lt": "lt",
+    "<=": "le", "le": "le",
+    ">": "gt", "gt": "gt",
+    ">=": "ge", "ge": "ge",
+}
+
+
+def parse_filter_query(query):
+    """
+    -> [(column, op, value, case), ...]  (op in eq/ne/lt/le/gt/ge/contains/datestartswith,
+    case False only for i-prefixed ops and plain contains)
+    """
+    parts = []
+    for raw in (query or "").split(" && "):
+        raw = raw.strip()
+        if not raw:
+            continue
+
+        m = _FILTER_PART_RE.match(raw)
+        if not m:
+            raise ValueError(f"Cannot parse filter: {raw}")
+
+        op = _OPS.get(m.group("op"), m.group("op"))
+        if m.group("case"):
+            case = m.group("case") == "s"
+        else:
+            case = op != "contains"  # plain contains has always ignored case
+        val = m.group("val").strip()
+        if len(val) >= 2 and val[0] == val[-1] and val[0] in "\"'`":
+            val = val[1:-1]
+        elif op in _OPS.values():
+            try:
+                val = float(val)
+            except ValueError:
+                pass
+
+        parts.append((m.group("col"), op, val, case))
+    return parts
+
+
+def apply_filter(df, query):
+    mask = np.ones(len(df), dtype=bool)
+
+    for col, op, val, case in parse_filter_query(query):
+        if col not in df.columns:
+            continue
+        s = df[col]
+
+        if op == "contains":
+            mask &= s.astype(str).str.contains(str(val), case=case, regex=False).to_numpy()
+            continue
+        if isinstance(val, float) and pd.api.types.is_numeric_dtype(s):
+            mask &= getattr(s, op)(val).to_numpy()
+            continue
+
+        s, val = s.astype(str), str(val)
+        if not case:
+            s, val = s.str.lower(), val.lower()
+        if op == "datestartswith":
+            mask &= s.str.startswith(val).to_numpy()
+        else:
+            mask &= getattr(s, op)(val).to_numpy()
+
+    return df[mask]
+
+
+def apply_sort(df, sort_by):
+    if not sort_by:
+        return df
+
+    cols = [s["column_id"] for s in sort_by if s["column_id"] in df.columns]
+    asc = [s["direction"] == "asc" for s in sort_by if s["column_id"] in df.columns]
+    if not cols:
+        return df
+    return df.sort_values(cols, ascending=asc, kind="stable", na_position="last")
+
+
+class PageCache:
+    """
+    Filtered + sorted views keyed by (table, version, filter, sort), so
+    flipping pages only slices, it never re-filters or re-sorts.
+    """
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self._views = OrderedDict()
+        # dash runs callbacks on several threads
+        self._lock = threading.Lock()
+
+    def view(self, name, version, df, filter_query=None, sort_by=None):
+        key = (
+            name,
+            version,
+            filter_query or "",
+            tuple((s["column_id"], s["direction"]) for s in sort_by or []),
+        )
+
+        with self._lock:
+            hit = self._views.get(key)
+            if hit is not None:
+                self._views.move_to_end(key)
+                return hit
+
+        out = apply_sort(apply_filter(df, filter_query), sort_by)
+        with self._lock:
+            self._views[key] = out
+            self._views.move_to_end(key)
+            if len(self._views) > self.maxsize:
+                self._views.popitem(last=False)
+        return out
+
+    def page(self, name, version, df, page_current, page_size, filter_query=None, sort_by=None):
+        """
+        -> (records for the visible page only, page_count, total_rows)
+        """
+        out = self.view(name, version, df, filter_query, sort_by)
+        page_current = page_current or 0
+        start = page_current * page_size
+
+        records = out.iloc[start:start + page_size].to_dict("records")
+        page_count = max(1, -(-len(out) // page_size))
+        return records, page_count, len(out)
@@ -0,0 +1,227 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+from config import PROFILE
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# =========================================================
+# STATE
+# =========================================================
+# Off by default. Flip config.PROFILE, set TS_PROFILE=1 or call enable().
+ENABLED = PROFILE or os.environ.get("TS_PROFILE", "") not in ("", "0")
+
+_events = []
+_lock = threading.Lock()
+_t0 = time.perf_counter_ns()
+
+
+class _NullSpan:
+    """
+    Shared no-op span returned when profiling is off.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "tags", "start", "blocks")
+
+    def __init__(self, name, tags):
+        self.name = name
+        self.tags = tags
+
+    def __enter__(self):
+        self.blocks = sys.getallocatedblocks()
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        event = {
+            "name": self.name,
+            "tags": self.tags,
+            "start_ns": self.start - _t0,
+            "dur_ns": end - self.start,
+            "alloc_blocks": sys.getallocatedblocks() - self.blocks,
+            "tid": threading.get_ident(),
+        }
+        with _lock:
+            _events.append(event)
+        return False
+
+
+def span(name, **tags):
+    """
+    Time a stage:  with span("load", symbol="TCS"): ...
+    """
+    if not ENABLED:
+        return _NULL_SPAN
+    return _Span(name, tags)
+
+
+def timed(name):
+    """
+    Decorator form of span().
+    """
+    def wrap(fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            with _Span(name, {}):
+                return fn(*args, **kwargs)
+
+        return inner
+
+    return wrap
+
+
+def enable(trace_memory=False):
+    global ENABLED
+    ENABLED = True
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def disable():
+    global ENABLED
+    ENABLED = False
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def reset():
+    global _t0
+    with _lock:
+        _events.clear()
+    _t0 = time.perf_counter_ns()
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+
+
+# =========================================================
+# MEMORY
+# =========================================================
+def peak_rss_mb():
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports KB, macOS reports bytes
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+# =========================================================
+# REPORTING
+# =========================================================
+def report():
+    with _lock:
+        events = list(_events)
+
+    stages = defaultdict(lambda: {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "alloc_blocks": 0})
+    symbols = defaultdict(float)
+
+    for e in events:
+        ms = e["dur_ns"] / 1e6
+        s = stages[e["name"]]
+        s["count"] += 1
+        s["total_ms"] += ms
+        s["max_ms"] = max(s["max_ms"], ms)
+        s["alloc_blocks"] += e["alloc_blocks"]
+
+        symbol = e["tags"].get("symbol")
+        if symbol is not None:
+            symbols[symbol] += ms
+
+    for s in stages.values():
+        s["mean_ms"] = s["total_ms"] / s["count"]
+
+    out = {
+        "stages": dict(stages),
+        "symbols_ms": dict(symbols),
+        "peak_rss_mb": peak_rss_mb(),
+        "events": len(events),
+    }
+
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        out["traced_current_mb"] = current / (1024 * 1024)
+        out["traced_peak_mb"] = peak / (1024 * 1024)
+
+    return out
+
+
+def print_summary(rep=None):
+    rep = rep or report()
+
+    print("\n⏱️ PROFILE SUMMARY")
+    print(f"{'Stage':24} {'Count':>7} {'Total ms':>11} {'Mean ms':>10} {'Max ms':>10} {'Blocks':>10}")
+
+    ordered = sorted(rep["stages"].items(), key=lambda kv: kv[1]["total_ms"], reverse=True)
+    for name, s in ordered:
+        print(f"{name[:24]:24} "
+              f"{s['count']:7d} "
+              f"{s['total_ms']:11.2f} "
+              f"{s['mean_ms']:10.3f} "
+              f"{s['max_ms']:10.3f} "
+              f"{s['alloc_blocks']:10d}")
+
+    if rep["peak_rss_mb"] is not None:
+        print(f"Peak RSS: {rep['peak_rss_mb']:.1f} MB")
+    if "traced_peak_mb" in rep:
+        print(f"Traced peak: {rep['traced_peak_mb']:.1f} MB")
+
+
+def write_chrome_trace(path):
+    """
+    Chrome trace event format, open in chrome://tracing or Perfetto.
+    """
+    with _lock:
+        events = list(_events)
+
+    pid = os.getpid()
+    trace = [
+        {
+            "name": e["name"],
+            "ph": "X",
+            "ts": e["start_ns"] / 1000,
+            "dur": e["dur_ns"] / 1000,
+            "pid": pid,
+            "tid": e["tid"],
+            "args": {**e["tags"], "alloc_blocks": e["alloc_blocks"]},
+        }
+        for e in events
+    ]
+
+    Path(path).write_text(json.dumps({"traceEvents": trace}))
+
+
+def write_report(path, chrome_trace=None):
+    rep = report()
+    Path(path).write_text(json.dumps(rep, indent=2, default=str))
+
+    if chrome_trace:
+        write_chrome_trace(chrome_trace)
+
+    return rep
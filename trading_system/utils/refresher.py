@@ -0,0 +1,111 @@
+import threading
+import time
+
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from config import SYSTEM_INPUTS, DASH_REFRESH_SECS, WATCH_POLL_SECS, LEADER_RETRY_SECS
+from core.engine import run_system
+from utils.profiler import span
+from utils.watcher import FolderWatcher, process_file
+
+
+def system_frame(output):
+    """
+    run_system() returns a dict ("NO TRADE") or a list of picks.
+    """
+    if isinstance(output, dict):
+        return pd.DataFrame([output])
+    if isinstance(output, list):
+        return pd.DataFrame(output)
+    return pd.DataFrame()
+
+
+def try_lock(path):
+    """
+    Non-blocking exclusive lock on `path`; returns the open file or None.
+    The OS drops the lock when the holder exits, even on a crash.
+    """
+    f = open(path, "a+")
+    try:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        f.close()
+        return None
+    return f
+
+
+class BackgroundRefresher(threading.Thread):
+    """
+    Keeps the ResultStore fresh off the request path: reruns run_system()
+    every `interval` seconds and immediately when a watched file changes
+    (changed files are also pushed through the watcher processors, and
+    their chart levels are prebuilt when a ChartCache is given).
+
+    With several dashboard workers only the process holding the store's
+    lock file computes; the others just read the shared store and take
+    over if the leader goes away.
+    """
+
+    def __init__(self, store, interval=DASH_REFRESH_SECS, poll=WATCH_POLL_SECS, watcher=None,
+                 charts=None):
+        super().__init__(daemon=True, name="results-refresher")
+        self.store = store
+        self.interval = interval
+        self.poll = poll
+        self.watcher = watcher or FolderWatcher()
+        self.charts = charts
+        self._stop_event = threading.Event()
+        self._leader_lock = None
+
+    @property
+    def is_leader(self):
+        return self._leader_lock is not None
+
+    def refresh_system(self):
+        with span("refresh.system"):
+            output = run_system(**SYSTEM_INPUTS)
+        self.store.put("system", system_frame(output))
+
+    def run(self):
+        next_run = 0.0
+
+        while not self._stop_event.is_set():
+            if not self.is_leader:
+                self._leader_lock = try_lock(self.store.root / ".refresher.lock")
+                if not self.is_leader:
+                    self._stop_event.wait(LEADER_RETRY_SECS)
+                    continue
+
+            changed = self.watcher.scan()
+            for path in changed:
+                try:
+                    process_file(path, self.store)
+                    if self.charts is not None and path.name.startswith("Quote-Equity-"):
+                        self.charts.get(path)
+                except Exception as e:
+                    print(f"❌ Error in {path.name}: {e}")
+
+            if changed or time.monotonic() >= next_run:
+                try:
+                    self.refresh_system()
+                except Exception as e:
+                    print(f"❌ Refresh failed: {e}")
+                next_run = time.monotonic() + self.interval
+
+            self._stop_event.wait(self.poll)
+
+        if self._leader_lock is not None:
+            self._leader_lock.close()
+            self._leader_lock = None
+
+    def stop(self):
+        self._stop_event.set()
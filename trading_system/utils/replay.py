@@ -0,0 +1,263 @@
+import asyncio
+import glob
+import inspect
+import sys
+import time
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from config import REPLAY_PATHS, REPLAY_SPEED, REPLAY_BAR_SECS, REPLAY_QUEUE_SIZE
+from core.strategies import trend_signals, sideways_signals, trend_strategy, sideways_strategy
+from utils.loader import PROJECT_ROOT, load_csv_cached, symbol_from_path
+
+
+class Tick(NamedTuple):
+    """
+    One bar for every symbol that traded on `date`.
+    """
+    seq: int
+    date: pd.Timestamp
+    symbols: list
+    rows: np.ndarray        # each bar's row in its symbol's history
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    sent_ns: int
+
+
+def resolve_paths(patterns=REPLAY_PATHS):
+    paths = []
+    for pattern in patterns:
+        paths += sorted(glob.glob(str(PROJECT_ROOT / pattern)))
+    return paths
+
+
+def load_histories(paths):
+    """
+    symbol -> normalised history frame (date sorted).
+    """
+    return {symbol_from_path(p): load_csv_cached(p) for p in paths}
+
+
+class ReplayFeed:
+    """
+    Replays historical bars through asyncio queues, one queue per subscriber.
+
+    speed=0 replays as fast as the subscribers keep up, otherwise one bar
+    takes bar_secs / speed seconds. Every tick is stamped when it is
+    published so subscribers' price -> action latency can be measured.
+    """
+
+    def __init__(self, histories, speed=REPLAY_SPEED, bar_secs=REPLAY_BAR_SECS, maxsize=REPLAY_QUEUE_SIZE):
+        self.speed = speed
+        self.bar_secs = bar_secs
+        self.maxsize = maxsize
+        self.subscribers = []    # (name, fn, is_async)
+        self.latency_ns = {}     # name -> list of latencies
+        self.ticks = self._build_ticks(histories)
+
+    @staticmethod
+    def _build_ticks(histories):
+        frames = []
+        for symbol, df in histories.items():
+            if "date" not in df.columns:
+                continue
+            frames.append(df[["date", "open", "high", "low", "close", "volume"]].assign(symbol=symbol, row=np.arange(len(df))))
+
+        if not frames:
+            return []
+
+        panel = pd.concat(frames, ignore_index=True).sort_values(["date", "symbol", "row"], kind="stable")
+
+        # group once up front, the publish loop only hands out arrays
+        ticks = []
+        for date, g in panel.groupby("date", sort=True):
+            ticks.append((
+                date,
+                g["symbol"].tolist(),
+                g["row"].to_numpy(),
+                g["open"].to_numpy(),
+                g["high"].to_numpy(),
+                g["low"].to_numpy(),
+                g["close"].to_numpy(),
+                g["volume"].to_numpy(),
+            ))
+        return ticks
+
+    def subscribe(self, fn, name=None):
+        """
+        fn(tick) may be a plain function or a coroutine function.
+        """
+        name = name or getattr(fn, "__name__", f"sub{len(self.subscribers)}")
+        self.subscribers.append((name, fn, inspect.iscoroutinefunction(fn)))
+        self.latency_ns[name] = []
+        return fn
+
+    async def _consume(self, name, fn, is_async, queue):
+        record = self.latency_ns[name].append
+        while True:
+            tick = await queue.get()
+            if tick is None:
+                return
+            if is_async:
+                await fn(tick)
+            else:
+                fn(tick)
+            record(time.perf_counter_ns() - tick.sent_ns)
+
+    async def _publish(self, queues, start):
+        delay = self.bar_secs / self.speed if self.speed else 0
+
+        for seq, (date, *fields) in enumerate(self.ticks):
+            if delay:
+                # pace against the start time so sleep jitter does not accumulate
+                wait = start + seq * delay - time.perf_counter()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+            tick = Tick(seq, date, *fields, time.perf_counter_ns())
+            for q in queues:
+                await q.put(tick)
+
+            if not delay:
+                await asyncio.sleep(0)
+
+        for q in queues:
+            await q.put(None)
+
+    async def run(self):
+        """
+        Replay every tick. A subscriber that raises cancels the feed (and the
+        other subscribers) and its exception is re-raised here.
+        """
+        queues = [asyncio.Queue(self.maxsize) for _ in self.subscribers]
+        start = time.perf_counter()
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for (name, fn, is_async), q in zip(self.subscribers, queues):
+                    tg.create_task(self._consume(name, fn, is_async, q))
+                tg.create_task(self._publish(queues, start))
+        except BaseExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+
+        return self.stats(time.perf_counter() - start)
+
+    def stats(self, elapsed):
+        bars = sum(len(t[1]) for t in self.ticks)
+        out = {
+            "ticks": len(self.ticks),
+            "bars": bars,
+            "elapsed_s": elapsed,
+            "bars_per_sec": bars / elapsed if elapsed else None,
+            "latency_us": {},
+        }
+        for name, lat in self.latency_ns.items():
+            if not lat:
+                continue
+            us = np.asarray(lat) / 1000
+            out["latency_us"][name] = {
+                "p50": float(np.percentile(us, 50)),
+                "p99": float(np.percentile(us, 99)),
+                "max": float(us.max()),
+            }
+        return out
+
+
+# =========================================================
+# SUBSCRIBERS
+# =========================================================
+def strategy_subscriber(histories, on_signal=None):
+    """
+    Runs trend_strategy / sideways_strategy on each symbol's history up to
+    the replayed bar, like the live path would on a new bar. Its latency is
+    the real per-bar strategy cost.
+    """
+    def strategies(tick):
+        for symbol, row in zip(tick.symbols, tick.rows):
+            upto = histories[symbol].iloc[:row + 1]
+            if trend_strategy(upto):
+                signal = "TREND"
+            elif sideways_strategy(upto):
+                signal = "SIDEWAYS"
+            else:
+                continue
+            if on_signal:
+                on_signal(tick.date, symbol, signal)
+
+    return strategies
+
+
+def signal_lookup_subscriber(histories, on_signal=None):
+    """
+    Dispatch-latency probe: same signals as strategy_subscriber, but looked
+    up from series computed once per symbol (they are causal, rolling / ewm
+    only). Its latency is the feed's queue + dispatch overhead, not the
+    strategy.
+    """
+    signals = {}
+    for symbol, df in histories.items():
+        if "date" not in df.columns:
+            continue
+        signals[symbol] = np.where(trend_signals(df), "TREND",
+                                   np.where(sideways_signals(df), "SIDEWAYS", ""))
+
+    def signal_lookup(tick):
+        for symbol, row in zip(tick.symbols, tick.rows):
+            signal = signals[symbol][row]
+            if signal and on_signal:
+                on_signal(tick.date, symbol, signal)
+
+    return signal_lookup
+
+
+def position_subscriber(book, stop_pct=0.05, on_action=None):
+    """
+    Feeds closes into a position book (anything with open_position /
+    update_prices, e.g. files/position_engine.PositionBook). Symbols without
+    a position are opened at their first close with a stop_pct stop.
+    """
+    def positions(tick):
+        for symbol, close in zip(tick.symbols, tick.close):
+            if symbol not in book:
+                book.open_position(symbol, close, close * (1 - stop_pct), 1)
+
+        res = book.update_prices(tick.symbols, tick.close)
+        if on_action:
+            on_action(tick, res)
+
+    return positions
+
+
+def replay(histories, subscribers, speed=REPLAY_SPEED, bar_secs=REPLAY_BAR_SECS):
+    feed = ReplayFeed(histories, speed=speed, bar_secs=bar_secs)
+    for fn in subscribers:
+        feed.subscribe(fn)
+    return asyncio.run(feed.run())
+
+
+if __name__ == "__main__":
+    histories = load_histories(resolve_paths())
+
+    subscribers = [strategy_subscriber(histories)]
+
+    # the live trade manager's engine lives with the desktop tools
+    sys.path.append(str(PROJECT_ROOT.parent / "files"))
+    try:
+        from position_engine import PositionBook
+        subscribers.append(position_subscriber(PositionBook()))
+    except ImportError:
+        pass
+
+    # subscribers share one event loop, so the dispatch probe runs on its own
+    for subs in (subscribers, [signal_lookup_subscriber(histories)]):
+        stats = replay(histories, subs)
+
+        print(f"\n⏯️ Replayed {stats['bars']} bars / {stats['ticks']} ticks "
+              f"in {stats['elapsed_s']:.2f}s ({stats['bars_per_sec']:,.0f} bars/sec)")
+        for name, s in stats["latency_us"].items():
+            print(f"{name:14} p50 {s['p50']:9.1f}µs   p99 {s['p99']:9.1f}µs   max {s['max']:9.1f}µs")
@@ -0,0 +1,144 @@
+import importlib
+import multiprocessing as mp
+import re
+import subprocess
+import sys
+import time
+
+from utils.loader import PROJECT_ROOT
+
+# what a batch worker imports (must stay NumPy / pandas only)
+ANALYTICS_MODULES = [
+    "utils.loader",
+    "core.indicators",
+    "core.strategies",
+    "core.backtester",
+    "core.screener",
+    "core.engine",
+    "core.position_sizing",
+    "core.allocator",
+    "utils.store",
+    "utils.replay",
+]
+
+# optional / GUI dependencies that must only load on first use
+HEAVY_MODULES = [
+    "pandas_ta", "matplotlib", "tkinter", "dash", "plotly", "pyarrow", "scipy",
+]
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)")
+
+
+def _cold_import(module):
+    """
+    Fresh interpreter: (total import ms, heavy modules that got loaded).
+    """
+    code = (
+        f"import sys, {module}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+
+    total = 0
+    for m in _IMPORTTIME_RE.finditer(proc.stderr):
+        if m.group(2) == module:
+            total = int(m.group(1))
+    leaked = [m for m in proc.stdout.strip().split(",") if m]
+    return total / 1000, leaked
+
+
+def benchmark(modules=ANALYTICS_MODULES, repeat=5):
+    """
+    Best-of-`repeat` cold import time per module.
+    """
+    rows = []
+    for module in modules:
+        runs = [_cold_import(module) for _ in range(repeat)]
+        rows.append({
+            "module": module,
+            "best_ms": min(ms for ms, _ in runs),
+            "heavy": runs[0][1],
+        })
+    return rows
+
+
+# =========================================================
+# WORKER POOLS
+# =========================================================
+def worker_pool(max_workers=None, preload=ANALYTICS_MODULES, forkserver=None):
+    """
+    ProcessPoolExecutor for batch work.
+    With the platform's `fork` default the workers already inherit the
+    parent's imports, so that pool is used as-is. Where the default would
+    spawn (macOS) or forkserver (forkserver=True), workers fork from a
+    forkserver that has imported `preload`, so each one skips the NumPy /
+    pandas import; the server starts with the first such pool and is reused.
+    Where forkserver is unavailable (Windows) this is the default pool.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if forkserver is None:
+        forkserver = mp.get_start_method(allow_none=False) != "fork"
+    if not forkserver or "forkserver" not in mp.get_all_start_methods():
+        return ProcessPoolExecutor(max_workers=max_workers)
+
+    ctx = mp.get_context("forkserver")
+    ctx.set_forkserver_preload(list(preload))
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx)
+
+
+def _touch(module):
+    importlib.import_module(module)
+    return module
+
+
+def pool_startup(method, workers=4, module="core.backtester"):
+    """
+    Seconds from creating a pool to every worker having imported `module`.
+    method: a multiprocessing start method, "preload" for a forkserver
+    worker_pool(), or "auto" for worker_pool() as batch code gets it.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    t0 = time.perf_counter()
+    if method == "preload":
+        pool = worker_pool(workers, forkserver=True)
+    elif method == "auto":
+        pool = worker_pool(workers)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context(method))
+    with pool:
+        list(pool.map(_touch, [module] * workers))
+    return time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    rows = benchmark()
+
+    print("\n🚀 COLD START (best of 5, fresh interpreter each)")
+    print(f"{'Module':24} {'Import ms':>10}  Heavy deps")
+    for r in rows:
+        heavy = ", ".join(r["heavy"]) or "-"
+        print(f"{r['module']:24} {r['best_ms']:10.1f}  {heavy}")
+
+    # the second preload pool reuses the running forkserver
+    runs = [(m, m) for m in ("fork", "spawn") if m in mp.get_all_start_methods()]
+    if "forkserver" in mp.get_all_start_methods():
+        runs += [("preload", "preload"), ("preload (warm)", "preload")]
+
+    runs.append(("worker_pool()", "auto"))
+
+    print(f"\n{'Pool start (4 workers)':24} {'ms':>10}")
+    times = {}
+    for label, method in runs:
+        times[label] = pool_startup(method) * 1000
+        print(f"{label:24} {times[label]:10.1f}")
+    if "spawn" in times:
+        print(f"✅ worker_pool() starts {times['spawn'] / times['worker_pool()']:.0f}x faster than spawn")
+
+    if any(r["heavy"] for r in rows):
+        print("❌ Heavy optional modules are on the analytics import path")
+        sys.exit(1)
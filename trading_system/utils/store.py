@@ -0,0 +1,152 @@
+import importlib.util
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+
+from config import RESULTS_DIR, STORE_MEMO_TABLES
+from utils.loader import PROJECT_ROOT
+
+# only check that pyarrow exists; pandas imports it on the first Parquet
+# read / write, so processes that never touch a table don't pay for it
+_EXT = ".parquet" if importlib.util.find_spec("pyarrow") else ".pkl"
+
+
+class ResultStore:
+    """
+    Directory of named result tables, one file per table
+    (Parquet when pyarrow is installed, pickle otherwise).
+
+    Writes go to a temp file + os.replace, so readers in other threads or
+    processes never see half a table. Reads are memoised on (mtime, size),
+    keeping at most `memo` tables per process; the files on disk are the
+    one shared copy between dashboard workers.
+    """
+
+    def __init__(self, root=None, memo=STORE_MEMO_TABLES):
+        self.root = Path(root) if root else PROJECT_ROOT / RESULTS_DIR
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.memo = memo
+        self._cache = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _path(self, name):
+        return self.root / f"{name}{_EXT}"
+
+    def _sig(self, path):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def version(self, name):
+        """
+        Changes whenever the table is rewritten (None if it does not exist).
+        """
+        return self._sig(self._path(name))
+
+    def names(self):
+        return sorted(p.stem for p in self.root.glob(f"*{_EXT}"))
+
+    def _remember(self, key, sig, value):
+        with self._lock:
+            self._cache[key] = (sig, value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.memo:
+                self._cache.popitem(last=False)
+
+    def _recall(self, key, sig):
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit is not None and hit[0] == sig:
+                self._cache.move_to_end(key)
+                return hit[1]
+        return None
+
+    def _atomic_write(self, path, write):
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        write(tmp)
+        os.replace(tmp, path)
+
+    def put(self, name, df):
+        path = self._path(name)
+
+        df = df.reset_index(drop=True)
+        if _EXT == ".parquet":
+            self._atomic_write(path, lambda tmp: df.to_parquet(tmp, index=False))
+        else:
+            self._atomic_write(path, df.to_pickle)
+
+        self._remember(name, self._sig(path), df)
+
+    def get(self, name):
+        path = self._path(name)
+        sig = self._sig(path)
+        if sig is None:
+            return None
+
+        df = self._recall(name, sig)
+        if df is not None:
+            return df
+
+        df = pd.read_parquet(path) if _EXT == ".parquet" else pd.read_pickle(path)
+        self._remember(name, sig, df)
+        return df
+
+    def put_object(self, name, obj):
+        """
+        Any picklable object (e.g. precomputed chart levels).
+        """
+        path = self.root / f"{name}.obj"
+
+        def write(tmp):
+            with open(tmp, "wb") as f:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self._atomic_write(path, write)
+        self._remember(("obj", name), self._sig(path), obj)
+
+    def get_object(self, name):
+        path = self.root / f"{name}.obj"
+        sig = self._sig(path)
+        if sig is None:
+            return None
+
+        obj = self._recall(("obj", name), sig)
+        if obj is not None:
+            return obj
+
+        with open(path, "rb") as f:
+            obj = pickle.load(f)
+        self._remember(("obj", name), sig, obj)
+        return obj
+
+    def upsert(self, name, df, key):
+        """
+        Replace rows whose `key` columns match, append the rest.
+        """
+        with self._lock:
+            old = self.get(name)
+            if old is not None and len(old):
+                new_keys = pd.MultiIndex.from_frame(df[key])
+                keep = ~pd.MultiIndex.from_frame(old[key]).isin(new_keys)
+                df = pd.concat([old[keep], df], ignore_index=True)
+            self.put(name, df)
+        return df
+
+    def query(self, name, where=None, columns=None):
+        """
+        store.query("signals", "strategy == 'TREND'", ["symbol", "close"])
+        """
+        df = self.get(name)
+        if df is None:
+            return pd.DataFrame()
+        if where:
+            df = df.query(where)
+        if columns:
+            df = df[columns]
+        return df
@@ -0,0 +1,193 @@
+import fnmatch
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from config import (
+    WATCH_DIRS, WATCH_PATTERNS, WATCH_POLL_SECS, WATCH_DEBOUNCE_SECS,
+)
+from core.analytics import save_run
+from core.filters import market_regime, sector_strength
+from core.indicators import atr
+from core.screener import run_screens
+from core.strategies import trend_strategy, sideways_strategy
+from utils.loader import PROJECT_ROOT, load_csv_cached, symbol_from_path
+from utils.profiler import span
+from utils.store import ResultStore
+
+
+class FolderWatcher:
+    """
+    Polls folders for new / changed files using (mtime, size).
+
+    A file is only reported after its signature has stayed the same for
+    `debounce` seconds, so half-written exports are never picked up.
+    """
+
+    def __init__(self, dirs=WATCH_DIRS, patterns=WATCH_PATTERNS, debounce=WATCH_DEBOUNCE_SECS):
+        self.dirs = [(PROJECT_ROOT / d).resolve() for d in dirs]
+        self.patterns = patterns
+        self.debounce = debounce
+        self.seen = {}       # path -> signature already processed
+        self.pending = {}    # path -> (signature, first seen at)
+
+    def files(self):
+        """
+        Every file in the watched folders matching the patterns.
+        """
+        for d in self.dirs:
+            if not d.is_dir():
+                continue
+            for p in d.iterdir():
+                if any(fnmatch.fnmatch(p.name, pat) for pat in self.patterns):
+                    yield p
+
+    def scan(self, now=None):
+        now = time.monotonic() if now is None else now
+        ready = []
+        present = set()
+
+        for p in self.files():
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            sig = (st.st_mtime_ns, st.st_size)
+            present.add(p)
+
+            if self.seen.get(p) == sig:
+                continue
+
+            pend = self.pending.get(p)
+            if pend is None or pend[0] != sig:
+                self.pending[p] = (sig, now)
+            elif now - pend[1] >= self.debounce:
+                ready.append(p)
+                self.seen[p] = sig
+                del self.pending[p]
+
+        # forget deleted files, a re-created one is picked up as new
+        for gone in (self.seen.keys() | self.pending.keys()) - present:
+            self.seen.pop(gone, None)
+            self.pending.pop(gone, None)
+
+        return ready
+
+
+# =========================================================
+# PROCESSORS (only the outputs affected by one file)
+# =========================================================
+def process_quote(path, store):
+    df = load_csv_cached(path)
+    symbol = symbol_from_path(path)
+    last = df.iloc[-1]
+
+    if trend_strategy(df):
+        strategy = "TREND"
+    elif sideways_strategy(df):
+        strategy = "SIDEWAYS"
+    else:
+        strategy = "NONE"
+
+    updated = datetime.now()
+    store.upsert("signals", pd.DataFrame([{
+        "symbol": symbol,
+        "strategy": strategy,
+        "date": last.get("date"),
+        "close": last["close"],
+        "source": path.name,
+        "updated": updated,
+    }]), key=["symbol"])
+
+    atr_val = atr(df).iloc[-1]
+    avg_vol = df["volume"].rolling(20).mean().iloc[-1]
+    store.upsert("volatility", pd.DataFrame([{
+        "symbol": symbol,
+        "close": last["close"],
+        "atr": atr_val,
+        "atr_pct": atr_val / last["close"] * 100,
+        "volume_spike": bool(last["volume"] > 1.5 * avg_vol),
+        "source": path.name,
+        "updated": updated,
+    }]), key=["symbol"])
+
+    return ["signals", "volatility"]
+
+
+def process_snapshot(path, store):
+    df = load_csv_cached(path)
+
+    screens = run_screens(df)
+    screens["source"] = path.name
+    store.upsert("screens", screens, key=["source", "symbol"])
+
+    tables = ["screens"]
+
+    folder = path.parent.name
+    if folder in ("indices", "sectors"):
+        check = market_regime if folder == "indices" else sector_strength
+        store.upsert("regime", pd.DataFrame([{
+            "source": path.name,
+            "kind": folder,
+            "ok": bool(check(df)),
+            "updated": datetime.now(),
+        }]), key=["source"])
+        tables.append("regime")
+
+    return tables
+
+
+def process_trades(path, store):
+    """
+    backtest_trades*.csv -> one backtest run (id = file stem).
+    """
+    save_run(store, path.stem, pd.read_csv(path))
+    return [f"bt_{path.stem}"]
+
+
+def process_file(path, store):
+    path = Path(path)
+    with span("watch.process", file=path.name):
+        if path.name.startswith("Quote-Equity-"):
+            return process_quote(path, store)
+        if path.name.startswith("backtest_trades"):
+            return process_trades(path, store)
+        return process_snapshot(path, store)
+
+
+# =========================================================
+# LOOP
+# =========================================================
+def watch(store=None, watcher=None, poll=WATCH_POLL_SECS, stop=None, on_update=None):
+    """
+    Run until `stop` (a threading.Event) is set, or forever.
+    on_update(path, tables) is called after each processed file.
+    """
+    store = store or ResultStore()
+    watcher = watcher or FolderWatcher()
+
+    print(f"👀 Watching {len(watcher.dirs)} folders → {store.root}")
+
+    while stop is None or not stop.is_set():
+        for path in watcher.scan():
+            t0 = time.perf_counter()
+            try:
+                tables = process_file(path, store)
+            except Exception as e:
+                print(f"❌ Error in {path.name}: {e}")
+                continue
+
+            print(f"✅ {path.name} → {', '.join(tables)} ({(time.perf_counter() - t0) * 1000:.0f} ms)")
+            if on_update:
+                on_update(path, tables)
+
+        if stop is None:
+            time.sleep(poll)
+        else:
+            stop.wait(poll)
+
+
+if __name__ == "__main__":
+    watch()
@@ -1,6 +1,13 @@
 import pandas as pd
 import numpy as np
 import glob
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# symbol_from_path is shared with trading_system
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "trading_system"))
+from core.screen_engine import symbol_from_path
 
 # =========================================================
 # CONFIG
@@ -13,6 +20,12 @@ SPLIT_RATIO_TRIGGER = 1.8  # detect only large drops
 ALLOWED_RATIOS = np.array([2, 3, 4, 5, 10])  # safe split ratios
 RATIO_TOLERANCE = 0.08  # 8% tolerance for noise
 
+# Universe report
+SWING_ATR_MULT = 1.5
+VOLUME_SPIKE_MULT = 1.5
+REALIZED_WINDOW = 20
+TRADING_DAYS = 252
+
 # =========================================================
 # HELPERS
 # =========================================================
@@ -134,7 +147,11 @@ def add_atr(df, period=ATR_PERIOD):
 # =========================================================
 # MAIN ANALYSIS FUNCTION
 # =========================================================
-def analyze_volatility_from_csv(file_path):
+def load_ohlcv(file_path):
+    """
+    Read an NSE quote CSV into Date/Open/High/Low/Prev Close/Close/Volume
+    (cleaned, date sorted). Returns None if a column can't be detected.
+    """
     df = pd.read_csv(file_path)
 
     # Standardize column names
@@ -162,7 +179,7 @@ def analyze_volatility_from_csv(file_path):
     for req in required:
         if req not in column_map:
             print(f"❌ Error: Couldn't detect column for '{req}' in {file_path}")
-            return
+            return None
 
     # Rename
     df = df.rename(columns={v: k for k, v in column_map.items()})
@@ -177,6 +194,14 @@ def analyze_volatility_from_csv(file_path):
 
     df = df.dropna(subset=["Open", "High", "Low", "Close", "Volume"]).reset_index(drop=True)
 
+    return df
+
+
+def analyze_volatility_from_csv(file_path):
+    df = load_ohlcv(file_path)
+    if df is None:
+        return
+
     # =========================================================
     # ✅ SAFE SPLIT ADJUSTMENT
     # =========================================================
@@ -253,16 +278,150 @@ def analyze_volatility_from_csv(file_path):
 
 
 # =========================================================
-# RUN ALL CSV FILES
+# UNIVERSE VOLATILITY REPORT
+# =========================================================
+def _load_adjusted(file_path):
+    try:
+        df = load_ohlcv(file_path)
+    except Exception as e:
+        print(f"❌ Error in {file_path}: {e}")
+        return None
+    if df is None or df.empty:
+        return None
+
+    df, _ = safe_auto_adjust_splits(df)
+    df["Symbol"] = symbol_from_path(file_path)
+    return df[["Symbol", "Date", "Open", "High", "Low", "Close", "Volume"]]
+
+
+def load_panel(files, workers=None):
+    """
+    Every file loaded + split adjusted in parallel, stacked symbol/date sorted.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        frames = [f for f in pool.map(_load_adjusted, files, chunksize=16) if f is not None]
+
+    if not frames:
+        return None
+
+    panel = pd.concat(frames, ignore_index=True)
+    return panel.sort_values(["Symbol", "Date"], kind="stable").reset_index(drop=True)
+
+
+def volatility_panel(panel, atr_period=ATR_PERIOD, window=REALIZED_WINDOW):
+    """
+    ATR / volume / realized volatility columns for every row of the
+    symbol-sorted panel, one grouped pass per indicator (no per-file loop).
+    """
+    df = panel.copy()
+    sym = df["Symbol"]
+    g = df.groupby(sym, sort=False)
+
+    high, low, open_, close = (df[c].to_numpy(dtype=float) for c in ["High", "Low", "Open", "Close"])
+    prev_close = g["Close"].shift(1).to_numpy(dtype=float)
+
+    # Wilder ATR (same as add_atr, per symbol)
+    tr = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    df["TR"] = tr
+    df["ATR"] = (
+        df["TR"].groupby(sym, sort=False)
+        .ewm(alpha=1 / atr_period, adjust=False, min_periods=atr_period).mean()
+        .droplevel(0)
+    )
+    df["VolumeAvg20"] = df["Volume"].groupby(sym, sort=False).rolling(VOL_AVG_PERIOD).mean().droplevel(0)
+
+    # realized volatility estimators, annualised %
+    log_hl = np.log(high / low)
+    log_co = np.log(close / open_)
+    log_cc = np.log(close / prev_close)
+
+    def rolling_mean(x):
+        return pd.Series(x, index=df.index).groupby(sym, sort=False).rolling(window).mean().droplevel(0)
+
+    annual = np.sqrt(TRADING_DAYS) * 100
+    df["Parkinson Vol %"] = np.sqrt(rolling_mean(log_hl ** 2) / (4 * np.log(2))) * annual
+    df["Garman-Klass Vol %"] = np.sqrt(
+        rolling_mean(0.5 * log_hl ** 2 - (2 * np.log(2) - 1) * log_co ** 2).clip(lower=0)
+    ) * annual
+    df["Close-Close Vol %"] = (
+        pd.Series(log_cc, index=df.index).groupby(sym, sort=False).rolling(window).std().droplevel(0) * annual
+    )
+
+    df["ATR %"] = df["ATR"] / df["Close"] * 100
+    return df
+
+
+def _own_history_rank(df, col):
+    """
+    Percentile of each symbol's latest value within its own history.
+    """
+    s = df[col]
+    last = s.groupby(df["Symbol"], sort=False).transform("last")
+    at_or_below = (s <= last).where(s.notna())
+    return at_or_below.groupby(df["Symbol"], sort=False).mean() * 100
+
+
+def volatility_report(folder_pattern="csv file/*.csv", out_path=None, workers=None):
+    """
+    One ranked table for the whole universe (latest bar per symbol), written
+    to out_path as .parquet or .csv when given.
+    """
+    files = glob.glob(folder_pattern)
+    if not files:
+        print("❌ No CSV files found.")
+        return None
+
+    panel = load_panel(files, workers)
+    if panel is None:
+        print("❌ No usable CSV files.")
+        return None
+
+    df = volatility_panel(panel)
+
+    latest = df.groupby("Symbol", sort=False).tail(1).set_index("Symbol")
+    latest = latest.dropna(subset=["ATR", "VolumeAvg20"])
+
+    atr_pct = latest["ATR %"]
+    report = pd.DataFrame({
+        "Date": latest["Date"],
+        "Close": latest["Close"],
+        "ATR": latest["ATR"],
+        "ATR %": atr_pct,
+        "Volatility Sentiment": np.select(
+            [atr_pct < 5, atr_pct <= 10], ["Low", "Moderate"], "High"
+        ),
+        "Volume": latest["Volume"],
+        "VolumeAvg20": latest["VolumeAvg20"],
+        "Volume Spike": latest["Volume"] > VOLUME_SPIKE_MULT * latest["VolumeAvg20"],
+        "Range Low": latest["Close"] - latest["ATR"],
+        "Range High": latest["Close"] + latest["ATR"],
+        "Swing Stop": latest["Close"] - latest["ATR"] * SWING_ATR_MULT,
+        "Parkinson Vol %": latest["Parkinson Vol %"],
+        "Garman-Klass Vol %": latest["Garman-Klass Vol %"],
+        "Close-Close Vol %": latest["Close-Close Vol %"],
+        "ATR % Rank": _own_history_rank(df, "ATR %"),
+        "Close-Close Vol Rank": _own_history_rank(df, "Close-Close Vol %"),
+    }).loc[latest.index]
+
+    report = report.sort_values(["ATR % Rank", "ATR %"], ascending=False)
+    report.index.name = "Symbol"
+
+    if out_path:
+        if str(out_path).endswith(".parquet"):
+            report.to_parquet(out_path)
+        else:
+            report.to_csv(out_path)
+        print(f"✅ Volatility report for {len(report)} symbols → {out_path}")
+
+    return report
+
+
+# =========================================================
+# RUN
 # =========================================================
 if __name__ == "__main__":
     folder_path = "/home/sri-jaya-shankaran/PycharmProjects/stock/csv file/*.csv"
-    csv_files = glob.glob(folder_path)
+    report = volatility_report(folder_path, "volatility_report.csv")
 
-    if not csv_files:
-        print("❌ No CSV files found.")
-    else:
-        for file_path in csv_files:
-            print("\n===================================================")
-            print("Processing:", file_path)
-            analyze_volatility_from_csv(file_path)
\ No newline at end of file
+    if report is not None:
+        print(report.head(20).to_string())